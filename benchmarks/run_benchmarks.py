@@ -0,0 +1,223 @@
+"""Headless benchmarks for the clock's hot paths.
+
+Run from the repository root:
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+
+Qt is forced onto the offscreen platform, so no display is needed.
+"""
+import argparse
+import datetime
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+FONTS_DIR = os.path.join(ROOT_DIR, 'fonts')
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, 'benchmarks', 'baseline.json')
+sys.path.insert(0, SRC_DIR)
+
+from PyQt5.QtWidgets import QApplication
+
+def measure(func, runs, setup=None):
+    """Call func runs times and return timing statistics in milliseconds."""
+    samples = []
+    for i in range(runs):
+        if setup:
+            setup(i)
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'mean_ms': statistics.mean(samples),
+        'runs': runs,
+    }
+
+def bench_config(work_dir, runs):
+    """Measure config parsing, snapshot loading and saving."""
+    from utils.config_manager import ConfigManager
+    config_file = os.path.join(work_dir, 'bench_config.yaml')
+    ConfigManager(config_file).save_config()
+
+    def remove_snapshot(i):
+        if os.path.exists(config_file + '.cache'):
+            os.remove(config_file + '.cache')
+
+    manager = ConfigManager(config_file)
+    return {
+        'config_load_yaml': measure(lambda: ConfigManager(config_file, write_delay=None), runs, remove_snapshot),
+        'config_load_snapshot': measure(lambda: ConfigManager(config_file, write_delay=None), runs),
+        'config_save': measure(manager.save_config, runs),
+    }
+
+def bench_fonts(work_dir, runs):
+    """Measure a cold font scan and an incremental rescan."""
+    from utils.font_manager import FontManager
+    index_file = os.path.join(work_dir, 'bench_font_index.json')
+
+    def remove_index(i):
+        if os.path.exists(index_file):
+            os.remove(index_file)
+
+    return {
+        'font_scan_cold': measure(lambda: FontManager(FONTS_DIR, index_file).load_custom_fonts(), runs, remove_index),
+        'font_scan_warm': measure(lambda: FontManager(FONTS_DIR, index_file).load_custom_fonts(), runs),
+    }
+
+def bench_widgets(work_dir, runs):
+    """Measure ticks, paints, style updates and the settings dialog."""
+    from utils.config_manager import ConfigManager
+    from utils.font_manager import font_manager
+    from ui.main_window import MainWindow
+    from ui.settings_window import SettingsWindow
+
+    font_manager.fonts_dir = FONTS_DIR
+    font_manager.index_file = os.path.join(work_dir, 'font_index.json')
+    font_manager.load_custom_fonts()
+    lcd_fonts = sorted(font_manager.lcd_fonts)
+
+    config_manager = ConfigManager(os.path.join(work_dir, 'widgets.yaml'), write_delay=None)
+    window = MainWindow(config_manager)
+    window.show()
+    app = QApplication.instance()
+    app.processEvents()
+    clock = window.clock_widget
+    clock.timer.stop()
+
+    results = {}
+    start = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    times = [start + datetime.timedelta(seconds=i) for i in range(runs)]
+    results['tick_update_time'] = measure(lambda: clock.update_time(times.pop()), runs)
+
+    for render_mode in ('labels', 'atlas'):
+        config_manager.set_setting('clock', 'render_mode', render_mode)
+        if lcd_fonts:
+            config_manager.set_setting('clock', 'font', lcd_fonts[0])
+            app.processEvents()
+            results[f'paint_lcd_{render_mode}'] = measure(clock.repaint, runs)
+        config_manager.set_setting('clock', 'font', 'Sans Serif')
+        app.processEvents()
+        results[f'paint_plain_{render_mode}'] = measure(clock.repaint, runs)
+    config_manager.set_setting('clock', 'render_mode', 'labels')
+
+    colors = [[i % 256, 128, 255 - i % 256, 255] for i in range(runs)]
+    results['update_style_color'] = measure(
+        lambda: config_manager.set_setting('clock', 'color', colors.pop()), runs)
+    results['update_style_full'] = measure(window.update_style, runs)
+
+    settings_window = None
+
+    def open_settings():
+        nonlocal settings_window
+        settings_window = SettingsWindow(config_manager)
+
+    results['settings_open_first'] = measure(open_settings, 1)
+    results['settings_reopen'] = measure(settings_window.load_settings, runs)
+
+    window.close()
+    return results
+
+def run_startup_probe(work_dir):
+    """Child process entry point: run main.main() and exit once the work deferred to the first paint is done."""
+    os.chdir(work_dir)
+    sys.argv = sys.argv[:1]
+    import main
+    finish_startup = main.finish_startup
+
+    def finish_and_quit(startup_timer, config_manager):
+        finish_startup(startup_timer, config_manager)
+        QApplication.instance().quit()
+
+    main.finish_startup = finish_and_quit
+    try:
+        main.main()
+    except SystemExit:
+        pass
+
+def bench_startup(work_dir, runs):
+    """Measure cold start to first clock paint in fresh processes."""
+    def start_app():
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--startup-probe', work_dir], check=True)
+    return {'startup_first_paint': measure(start_app, runs)}
+
+def compare(results, baseline, tolerance):
+    """Return the benchmarks whose median regressed by more than tolerance."""
+    regressions = {}
+    for name, stats in results['benchmarks'].items():
+        reference = baseline.get('benchmarks', {}).get(name)
+        if reference and stats['median_ms'] > reference['median_ms'] * (1 + tolerance):
+            regressions[name] = {'baseline_ms': reference['median_ms'], 'current_ms': stats['median_ms']}
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless clock benchmarks.")
+    parser.add_argument('--runs', type=int, default=200, help="iterations per micro-benchmark")
+    parser.add_argument('--startup-runs', type=int, default=5, help="cold starts to measure")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store the results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed median slowdown, e.g. 0.2 for 20%%")
+    parser.add_argument('--startup-probe', metavar='WORK_DIR', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_probe:
+        run_startup_probe(args.startup_probe)
+        return 0
+
+    app = QApplication(sys.argv[:1])
+    work_dir = tempfile.mkdtemp(prefix='clock-bench-')
+    shutil.copytree(FONTS_DIR, os.path.join(work_dir, 'fonts'))
+    try:
+        benchmarks = {}
+        benchmarks.update(bench_config(work_dir, args.runs))
+        benchmarks.update(bench_fonts(work_dir, max(1, args.runs // 20)))
+        benchmarks.update(bench_widgets(work_dir, args.runs))
+        benchmarks.update(bench_startup(work_dir, args.startup_runs))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    results = {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'qt_platform': app.platformName(),
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'benchmarks': benchmarks,
+    }
+
+    exit_code = 0
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            results['regressions'] = compare(results, json.load(f), args.tolerance)
+        exit_code = 1 if results['regressions'] else 0
+    else:
+        print(f"Warning: No baseline at {args.baseline}, nothing to compare against; record one with --save-baseline",
+              file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+    return exit_code
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,28 +1,167 @@
+import time
+STARTUP_TIME = time.perf_counter()
+
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
-from utils.config_manager import ConfigManager
-from ui.main_window import MainWindow
-from utils.font_manager import font_manager
+from utils.memory_report import memory_report, memory_report_requested
+if memory_report_requested():
+    # Trace from the start so allocations made during imports are attributed too
+    import tracemalloc
+    tracemalloc.start()
+# Only what forwarding to a running instance needs; the UI is imported once this launch starts a clock
+from utils.startup_timer import StartupTimer
+from utils.single_instance import InstanceServer, forward_to_running_instance, get_commands, get_server_name
+
+CONFIG_FILE = 'config.yaml'
 
-def load_fonts():
+def load_fonts(rescan=True):
     """Load custom fonts."""
-    font_manager.load_custom_fonts()
+    from utils.font_manager import font_manager
+    font_manager.load_custom_fonts(rescan)
     if not font_manager.get_custom_fonts():
         print("Warning: No custom fonts were loaded.")
 
+def get_argument_value(name, default=None):
+    """Return the value of a --name=value command line argument."""
+    prefix = f'--{name}='
+    for argument in sys.argv[1:]:
+        if argument.startswith(prefix):
+            return argument[len(prefix):]
+    return default
+
+def framebuffer_requested():
+    """Return True if the clock should publish frames to shared memory instead of opening a window."""
+    return any(argument == '--framebuffer' or argument.startswith('--framebuffer=') for argument in sys.argv)
+
+def create_framebuffer_clock(config_manager):
+    """Create a clock that is never shown and publishes its frames to shared memory."""
+    from ui.clock_widget import ClockWidget
+    from utils.framebuffer import FramebufferPublisher, get_default_path
+    width, height = (int(value) for value in get_argument_value('framebuffer-size', '480x155').split('x'))
+    clock_widget = ClockWidget(config_manager)
+    path = get_argument_value('framebuffer', get_default_path())
+    clock_widget.publisher = FramebufferPublisher(clock_widget, path, width, height)
+    print(f"Publishing {width}x{height} frames to {path}")
+    return clock_widget
+
+def single_instance_requested():
+    """Return True if this launch should hand over to an already running clock."""
+    return not framebuffer_requested() and '--new-instance' not in sys.argv
+
+def startup_timings_requested():
+    """Return True if phase timings should be printed once the clock is visible."""
+    return '--startup-timings' in sys.argv or bool(os.environ.get('CLOCK_STARTUP_TIMINGS'))
+
+def start_color_scheduler(config_manager, widget, parent):
+    """Drive the scheduled colors once a color schedule exists, so NumPy is not loaded without one."""
+    from utils.settings_definition import SETTINGS
+
+    def has_schedules():
+        schedules = config_manager.model.color_schedules
+        return any(getattr(schedules, key) for key in SETTINGS['color_schedules'])
+
+    def start():
+        from utils.color_schedule import ColorScheduler
+        # Kept alive by its Qt parent
+        ColorScheduler(config_manager, widget, parent)
+
+    def start_when_scheduled(changes):
+        if has_schedules():
+            config_manager.unsubscribe(start_when_scheduled)
+            start()
+
+    if has_schedules():
+        start()
+    else:
+        config_manager.subscribe(start_when_scheduled, [('color_schedules', None)])
+
+def finish_startup(startup_timer, config_manager):
+    """Do the work deferred until after the first frame."""
+    startup_timer.mark('first_paint')
+    if startup_timings_requested():
+        startup_timer.dump({'config_load': config_manager.load_stats})
+
+    # Pick up added or changed font files and prepare the settings font lists
+    from utils.font_manager import font_manager
+    font_manager.load_custom_fonts()
+    if config_manager.model.main_window.low_memory:
+        # Font lists are built when the settings open; only the clock font stays registered
+        font_manager.release_unused_fonts({config_manager.model.clock.font})
+    else:
+        from ui.font_model import preload_font_models
+        preload_font_models()
+    if memory_report_requested():
+        memory_report.dump('first_paint')
+
 def main():
     """Main function to run the application."""
-    app = QApplication(sys.argv)       
-
-    load_fonts()        
-            
-    config_manager = ConfigManager('config.yaml')
-    main_window = MainWindow(config_manager)
-    # Add a small delay before showing the main window
-    QTimer.singleShot(100, main_window.show)
+    startup_timer = StartupTimer(STARTUP_TIME)
+    startup_timer.mark('import')
+
+    instance_server = None
+    if single_instance_requested():
+        server_name = get_server_name(CONFIG_FILE)
+        commands = get_commands(sys.argv[1:])
+        # Blocking QLocalSocket calls need no QApplication, so a second launch exits without building one
+        if forward_to_running_instance(server_name, commands):
+            # The running clock takes over; skip the UI imports, fonts, config and windows
+            return
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    if single_instance_requested():
+        # Claim the name right away so launches during startup find this instance
+        instance_server = InstanceServer(server_name, app)
+        if not instance_server.is_listening() and forward_to_running_instance(server_name, commands):
+            return
+    startup_timer.mark('qapplication')
+
+    from PyQt5.QtCore import QTimer
+    from utils.config_manager import ConfigManager
+    from utils.config_watcher import ConfigWatcher
+    from utils.metrics import MetricsExporter
+    from ui.main_window import MainWindow
+    startup_timer.mark('ui_import')
+
+    # Trust the saved font index for now; it is rescanned after the first frame
+    load_fonts(rescan=False)
+    startup_timer.mark('fonts')
+
+    config_manager = ConfigManager(CONFIG_FILE)
+    # Kept alive by its Qt parent, like the exporter and the color scheduler
+    ConfigWatcher(config_manager, app)
+    startup_timer.mark('config')
+
+    if framebuffer_requested():
+        # Headless output, e.g. with QT_QPA_PLATFORM=offscreen
+        main_window = create_framebuffer_clock(config_manager)
+        first_frame_widget = None
+    elif '--world-clock' in sys.argv:
+        from ui.world_clock import WorldClockWindow
+        main_window = WorldClockWindow(config_manager)
+        first_frame_widget = main_window
+    else:
+        main_window = MainWindow(config_manager)
+        first_frame_widget = main_window.clock_widget
+    startup_timer.mark('window')
+    start_color_scheduler(config_manager, main_window, app)
+    if first_frame_widget is None:
+        QTimer.singleShot(0, lambda: finish_startup(startup_timer, config_manager))
+    else:
+        startup_timer.watch_first_paint(first_frame_widget, lambda: finish_startup(startup_timer, config_manager))
+        main_window.show()
+
+    if instance_server is not None:
+        # Commands are only delivered once the event loop runs, so none are missed
+        from ui.app_commands import AppCommands
+        app_commands = AppCommands(config_manager, main_window)
+        instance_server.command_received.connect(app_commands.run)
+
+    # Periodic JSON metrics dump, enabled with CLOCK_METRICS_FILE or CLOCK_METRICS_SOCKET
+    MetricsExporter.from_environment(app)
+    if memory_report_requested():
+        app.aboutToQuit.connect(lambda: memory_report.dump('exit'))
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
     main()
-    
\ No newline at end of file
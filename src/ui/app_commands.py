@@ -0,0 +1,64 @@
+from PyQt5.QtCore import Qt, QPoint
+from .main_window import MainWindow
+
+class AppCommands:
+    """Applies commands forwarded by later launches to the running application."""
+
+    # Offset of each additional window from the previous one
+    CASCADE_OFFSET = QPoint(30, 30)
+
+    def __init__(self, config_manager, main_window):
+        self.config_manager = config_manager
+        self.main_window = main_window
+        self.windows = []
+        self.handlers = {
+            'show': self.show_window,
+            'settings': self.open_settings,
+            'reload-config': self.reload_config,
+            'new-window': self.open_clock_window,
+            'world-clock': self.open_world_clock,
+        }
+
+    def run(self, command):
+        """Run one forwarded command."""
+        handler = self.handlers.get(command)
+        if handler is None:
+            print(f"Warning: Unknown command {command!r} from another instance")
+            return
+        handler()
+
+    def show_window(self):
+        """Bring the main window to the front."""
+        self.main_window.showNormal()
+        self.main_window.raise_()
+        self.main_window.activateWindow()
+
+    def open_settings(self):
+        """Open the settings window of the main clock."""
+        if hasattr(self.main_window, 'open_settings'):
+            self.main_window.open_settings()
+        else:
+            print("Warning: The world clock has no settings window")
+
+    def reload_config(self):
+        """Apply the values changed in the config file."""
+        self.config_manager.reload_config()
+
+    def open_clock_window(self):
+        """Open another clock window next to the last one."""
+        window = MainWindow(self.config_manager, primary=False)
+        anchor = self.windows[-1] if self.windows else self.main_window
+        window.move(anchor.pos() + self.CASCADE_OFFSET)
+        self.add_window(window)
+
+    def open_world_clock(self):
+        """Open a world clock wall."""
+        from .world_clock import WorldClockWindow
+        self.add_window(WorldClockWindow(self.config_manager))
+
+    def add_window(self, window):
+        """Show an additional window and forget it once it is closed."""
+        window.setAttribute(Qt.WA_DeleteOnClose)
+        window.destroyed.connect(lambda: self.windows.remove(window))
+        self.windows.append(window)
+        window.show()
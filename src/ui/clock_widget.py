@@ -1,14 +1,41 @@
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QSizePolicy
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont, QColor, QPainter
+from PyQt5.QtCore import Qt, QRectF, pyqtSignal
+from PyQt5.QtGui import QFont, QColor, QPainter, QPixmap, QGuiApplication
 import datetime
-from utils.font_manager import font_manager
+import math
+import time
+from utils.metrics import metrics
+from utils.tick_scheduler import TickScheduler
+from utils.frame_loop import FrameLoop
+from utils.stopwatch import Stopwatch
+from .glyph_atlas import get_glyph_atlas
+from .font_fit import font_metrics_cache
+from .style_cache import style_cache
 
 class ClockWidget(QWidget):
     """A widget that displays a digital clock with separate elements."""
 
-    def __init__(self, config_manager):
-        """Initialize the clock widget."""
+    # Emitted whenever what the clock shows has changed, for offscreen consumers
+    display_changed = pyqtSignal()
+
+    DIGIT_KEYS = ('hours', 'minutes', 'seconds')
+    # Elements drawn with the seconds font and color
+    SECONDS_KEYS = ('seconds', 'separator3', 'fraction')
+    FRACTION_KEYS = ('separator3', 'fraction')
+    DISPLAY_KEYS = {'display_mode', 'subsecond_digits'}
+    FONT_KEYS = {'font', 'font_size', 'seconds_font_size', 'use_custom_fonts', 'auto_fit'}
+    COLOR_KEYS = {'color', 'seconds_color', 'background_color'}
+    PADDING_KEYS = {'padding_horizontal', 'padding_vertical'}
+    # Stretch factors only depend on the shown elements and are shared by all clocks
+    stretch_factor_cache = {}
+
+    def __init__(self, config_manager, tick_source=None):
+        """Initialize the clock widget.
+
+        Without a tick_source the widget runs its own TickScheduler, and a
+        FrameLoop for sub-second and stopwatch displays. Clocks given a shared
+        tick_source are updated by its owner through update_time.
+        """
         super().__init__()
         self.config_manager = config_manager
         self.clock_elements = {
@@ -16,10 +43,32 @@ class ClockWidget(QWidget):
             'separator1': {'label': QLabel(':'), 'format': ':'},
             'minutes': {'label': QLabel(), 'format': '%M'},
             'separator2': {'label': QLabel(':'), 'format': ':'},
-            'seconds': {'label': QLabel(), 'format': '%S'}
+            'seconds': {'label': QLabel(), 'format': '%S'},
+            'separator3': {'label': QLabel('.'), 'format': '.'},
+            'fraction': {'label': QLabel(), 'format': '%f'}  # Cut to subsecond_digits
         }
+        for element in self.clock_elements.values():
+            element['text'] = None
+            element['rect'] = QRectF()
+        self.time_format = '|'.join(element['format'] for element in self.clock_elements.values())
+        self.seconds_shown = None
+        self.render_mode = 'labels'
+        self.glyph_atlases = {}
+        self.lcd_font = False
+        self.lcd_cache = None
+        self.lcd_cache_geometry = None
+        self.fraction_digits = 0
+        self.display_mode = 'clock'
+        self.stopwatch = Stopwatch()
+        self.frame_loop = None
+        self.auto_fit = False
+        self.fit_sizes = None
+        self.owns_timer = tick_source is None
+        self.timer = tick_source
         self.init_ui()
-        self.start_timer()
+        if self.owns_timer:
+            self.start_timer()
+        self.config_manager.subscribe(self.apply_changes, [('clock', None)])
 
     def init_ui(self):
         """Set up the user interface for the clock widget."""
@@ -37,123 +86,394 @@ class ClockWidget(QWidget):
         self.update_style()
 
     def start_timer(self):
-        """Start a timer to update the clock every second."""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)  # Update every second
-
-    def update_time(self):
-        """Update the displayed time for each element."""
-        current_time = datetime.datetime.now()
-        config = self.config_manager.get_config()
-        
+        """Start a scheduler that updates the clock on every wall-clock second, or minute without seconds."""
+        self.timer = TickScheduler(self, 1.0 if self.seconds_shown is not False else 60.0)
+        self.timer.tick.connect(self.on_tick)
+        self.timer.follow_visibility(self)
+        self.timer.start()
+
+    def get_skew_ms(self):
+        """Return the measured skew between displayed and actual time in milliseconds."""
+        return self.timer.get_skew_ms()
+
+    def on_tick(self, current_time):
+        """Update the display on a scheduler tick, unless the frame loop is driving it."""
+        if self.needs_frame_loop():
+            # Also restarts the loop after it stopped itself while hidden
+            self.update_frame_loop()
+            return
+        if self.display_mode == 'stopwatch':
+            current_time = self.stopwatch.as_datetime()
+        self.update_time(current_time)
+
+    def needs_frame_loop(self):
+        """Return True if the display changes faster than the scheduler ticks."""
+        if not self.owns_timer:
+            return False
+        return self.shows_fraction() or (self.display_mode == 'stopwatch' and self.stopwatch.running)
+
+    def update_frame_loop(self):
+        """Run the frame loop while it is needed and the clock is visible, stop it otherwise."""
+        if not self.needs_frame_loop():
+            if self.frame_loop is not None and self.frame_loop.is_active():
+                self.frame_loop.stop()
+                self.update_time()
+            return
+        if self.frame_loop is None:
+            self.frame_loop = FrameLoop(self)
+            self.frame_loop.frame.connect(self.render_frame)
+        if not self.frame_loop.is_active() and not self.timer.paused:
+            self.frame_loop.set_refresh_rate(self.get_refresh_rate())
+            self.frame_loop.start()
+
+    def get_refresh_rate(self):
+        """Return the refresh rate of the screen showing the clock."""
+        handle = self.window().windowHandle()
+        screen = handle.screen() if handle is not None else QGuiApplication.primaryScreen()
+        return screen.refreshRate() or 60
+
+    def render_frame(self):
+        """Draw one display frame, stopping the loop while the clock is not visible."""
+        if self.timer.paused:
+            self.frame_loop.stop()
+            return
+        self.update_time()
+
+    def get_frame_stats(self):
+        """Return the frame loop's achieved frame rate and counters, or None if it is not running."""
+        if self.frame_loop is None or not self.frame_loop.is_active():
+            return None
+        return self.frame_loop.get_stats()
+
+    def get_display_time(self):
+        """Return the time to display: the current time, or the stopwatch's elapsed time."""
+        if self.display_mode == 'stopwatch':
+            return self.stopwatch.as_datetime()
+        return datetime.datetime.now()
+
+    def toggle_stopwatch(self):
+        """Start or stop the stopwatch."""
+        if self.stopwatch.running:
+            self.stopwatch.stop()
+        else:
+            self.stopwatch.start()
+        self.update_frame_loop()
+        self.update_time()
+
+    def reset_stopwatch(self):
+        """Set the stopwatch back to zero."""
+        self.stopwatch.reset()
+        self.update_time()
+
+    def update_time(self, current_time=None):
+        """Update only the clock elements whose displayed text changed."""
+        start = time.perf_counter()
+        if current_time is None:
+            current_time = self.get_display_time()
+        clock = self.config_manager.model.clock
+
+        show_seconds = clock.show_seconds
+        if show_seconds != self.seconds_shown:
+            self.set_seconds_visible(show_seconds)
+
+        # Format every element with a single strftime call
+        texts = current_time.strftime(self.time_format).split('|')
+        changed = False
+        for (key, element), text in zip(self.clock_elements.items(), texts):
+            if key == 'fraction':
+                text = text[:self.fraction_digits]
+            if element['text'] != text:
+                element['text'] = text
+                changed = True
+                if self.render_mode == 'atlas':
+                    self.update(element['rect'].toAlignedRect())
+                else:
+                    element['label'].setText(text)
+        if changed:
+            self.display_changed.emit()
+        metrics.observe('tick_ms', (time.perf_counter() - start) * 1000)
+
+    def set_seconds_visible(self, visible):
+        """Show or hide the seconds and their separator."""
+        self.seconds_shown = visible
+        if self.owns_timer:
+            # Without seconds there is nothing to redraw between minutes
+            self.timer.set_interval(1.0 if visible else 60.0)
+            self.update_frame_loop()
+        self.update_label_visibility()
+        self.adjust_layout()
+
+    def shows_fraction(self):
+        """Return True if sub-second digits are displayed after the seconds."""
+        return bool(self.seconds_shown) and self.fraction_digits > 0
+
+    def is_element_shown(self, key):
+        """Return True if the element is part of the current display."""
+        if key in self.FRACTION_KEYS:
+            return self.shows_fraction()
+        return bool(self.seconds_shown) or key not in ('separator2', 'seconds')
+
+    def get_ghost_text(self, key):
+        """Return the widest text an element can show, used for layout and LCD ghost segments."""
+        if key == 'fraction':
+            return '8' * self.fraction_digits
+        return '88' if key in self.DIGIT_KEYS else self.clock_elements[key]['format']
+
+    def update_display_mode(self, clock):
+        """Take over the display mode and number of sub-second digits."""
+        self.display_mode = clock.display_mode
+        self.fraction_digits = clock.subsecond_digits
+        self.update_label_visibility()
+
+    def update_label_visibility(self):
+        """Show the labels required by the render mode and seconds setting."""
         for key, element in self.clock_elements.items():
-            if key == 'seconds' and not config['clock']['show_seconds']:
-                element['label'].hide()
-                self.clock_elements['separator2']['label'].hide()
-            else:
-                element['label'].setText(current_time.strftime(element['format']))
-                element['label'].show()
-                if key == 'minutes':
-                    self.clock_elements['separator2']['label'].show()
-        
-        self.update()
+            element['label'].setVisible(self.render_mode == 'labels' and self.is_element_shown(key))
 
     def update_style(self):
         """Update the style of each clock element based on the current configuration."""
-        config = self.config_manager.get_config()
-        for key, element in self.clock_elements.items():
-            self.apply_font(config, element['label'], key)
-            self.apply_colors(config, element['label'], key)
-        self.apply_padding(config)
+        clock = self.config_manager.model.clock
+        render_mode = clock.render_mode
+        if render_mode != self.render_mode:
+            self.render_mode = render_mode
+        self.update_display_mode(clock)
+
+        if self.render_mode == 'atlas':
+            self.update_glyph_atlases(clock)
+        else:
+            for key, element in self.clock_elements.items():
+                self.apply_font(clock, element['label'], key)
+                self.apply_colors(clock, element['label'], key)
+        self.apply_padding(clock)
+        self.lcd_font = clock.derived('lcd_font')
+        self.invalidate_lcd_background()
         self.adjust_layout()
         self.update()
+        self.display_changed.emit()
+
+    def apply_changes(self, changes):
+        """Apply only the parts of the style touched by a clock change-set."""
+        clock = self.config_manager.model.clock
+        keys = {change.key for change in changes}
+        if 'render_mode' in keys:
+            self.update_config()
+            return
 
-    def apply_font(self, config, label, element_key):
+        if 'show_seconds' in keys:
+            self.set_seconds_visible(clock.show_seconds)
+        if keys & self.DISPLAY_KEYS:
+            self.update_display_mode(clock)
+            self.invalidate_lcd_background()
+            self.adjust_layout()
+            self.update_frame_loop()
+            self.update_time()
+        if self.render_mode == 'atlas':
+            if keys & (self.FONT_KEYS | self.COLOR_KEYS):
+                self.update_glyph_atlases(clock)
+        else:
+            for key, element in self.clock_elements.items():
+                if keys & self.FONT_KEYS:
+                    self.apply_font(clock, element['label'], key)
+                if keys & self.COLOR_KEYS:
+                    self.apply_colors(clock, element['label'], key)
+        if keys & self.PADDING_KEYS or 'background_color' in keys:
+            self.apply_padding(clock)
+        if 'font' in keys:
+            self.lcd_font = clock.derived('lcd_font')
+        if keys & (self.FONT_KEYS | self.COLOR_KEYS | {'lcd_background_opacity'}):
+            self.invalidate_lcd_background()
+        if keys & (self.FONT_KEYS | self.PADDING_KEYS):
+            self.adjust_layout()
+        self.update()
+        self.display_changed.emit()
+
+    def create_font(self, clock, element_key):
+        """Return the font for a specific clock element, at the fitted size in auto-fit mode."""
+        seconds_role = element_key in self.SECONDS_KEYS
+        font = QFont(clock.derived('seconds_font' if seconds_role else 'main_font'))
+        if clock.auto_fit and self.fit_sizes is not None:
+            font.setPointSize(self.fit_sizes[1 if seconds_role else 0])
+        return font
+
+    def update_glyph_atlases(self, clock):
+        """Pick the shared glyph atlases for the current font, colors and pixel ratio."""
+        ratio = self.devicePixelRatioF()
+        atlases = {}
+        for role in ('main', 'seconds'):
+            font = self.create_font(clock, 'seconds' if role == 'seconds' else 'hours')
+            color = clock.qcolor('seconds_color' if role == 'seconds' else 'color')
+            atlases[role] = get_glyph_atlas(font, color, ratio)
+        self.glyph_atlases = atlases
+
+    def get_atlas(self, element_key):
+        """Return the glyph atlas used to draw a clock element."""
+        return self.glyph_atlases['seconds' if element_key in self.SECONDS_KEYS else 'main']
+
+    def layout_atlas_elements(self):
+        """Compute the rect of each clock element for atlas rendering."""
+        area = self.get_contents_area()
+        shown = [key for key in self.clock_elements if self.is_element_shown(key)]
+        widths = {key: self.get_atlas(key).text_width(self.get_ghost_text(key)) for key in shown}
+        x = area.x() + (area.width() - sum(widths.values())) / 2
+        for key, element in self.clock_elements.items():
+            if key in widths:
+                element['rect'] = QRectF(x, area.y(), widths[key], area.height())
+                x += widths[key]
+            else:
+                element['rect'] = QRectF()
+
+    def apply_font(self, clock, label, element_key):
         """Apply font settings to a specific clock element."""
-        use_custom_fonts = config['clock']['use_custom_fonts']
-        font_name = config['clock']['font']
-        font_size = config['clock']['font_size']
-        if element_key == 'seconds':
-            font_size = config['clock']['seconds_font_size']
-        font = font_manager.get_font(font_name, use_custom_fonts)
-        font.setPointSize(font_size)
-        label.setFont(font)
-
-    def apply_colors(self, config, label, element_key):
-        """Apply color settings to a specific clock element."""
-        if element_key == 'seconds':
-            color = QColor(*config['clock']['seconds_color'])
+        font = self.create_font(clock, element_key)
+        if label.font() != font:
+            label.setFont(font)
+
+    def apply_colors(self, clock, label, element_key):
+        """Apply color settings to a specific clock element through a shared palette."""
+        if element_key in self.SECONDS_KEYS:
+            color = clock.seconds_color
         else:
-            color = QColor(*config['clock']['color'])
-        bg_color = QColor(*config['clock']['background_color'])
-        label.setStyleSheet(f'''
-            color: rgba{color.getRgb()};
-            background-color: rgba{bg_color.getRgb()};
-        ''')
-
-    def apply_padding(self, config):
+            color = clock.color
+        style_cache.apply_palette(label, color, clock.background_color)
+
+    def apply_padding(self, clock):
         """Apply padding settings to the layout."""
-        padding_h = config['clock']['padding_horizontal']
-        padding_v = config['clock']['padding_vertical']
+        padding_h = clock.padding_horizontal
+        padding_v = clock.padding_vertical
         self.layout().setContentsMargins(padding_h, padding_v, padding_h, padding_v)
-        
-        background_color = QColor(*config['clock']['background_color'])
-        self.setStyleSheet(f'''
-            QWidget {{
-                background-color: rgba({background_color.red()}, {background_color.green()}, {background_color.blue()}, {background_color.alpha()});
-            }}
-        ''')
+        self.background_color = clock.qcolor('background_color')
+
+    def get_contents_area(self):
+        """Return the area inside the padding, where the clock elements are drawn."""
+        return QRectF(self.rect().marginsRemoved(self.layout().contentsMargins()))
 
     def paintEvent(self, event):
-        """Custom paint event to draw the LCD background if needed."""
+        """Custom paint event to draw the LCD background and atlas glyphs if needed."""
+        start = time.perf_counter()
         super().paintEvent(event)
-        config = self.config_manager.get_config()
-        if font_manager.is_lcd_font(config['clock']['font']):
-            self.draw_lcd_background(config)
+        clock = self.config_manager.model.clock
+        if self.render_mode == 'atlas' and self.glyph_atlases['main'].device_pixel_ratio != self.devicePixelRatioF():
+            self.update_glyph_atlases(clock)
+        if self.lcd_font:
+            self.draw_lcd_background(clock)
+        if self.render_mode == 'atlas':
+            # Filled over the LCD ghost, which it dims like the label backgrounds do in labels mode
+            painter = QPainter(self)
+            painter.fillRect(self.get_contents_area().intersected(QRectF(event.rect())), self.background_color)
+            painter.end()
+            self.draw_atlas_elements(event.rect())
+        metrics.observe('paint_ms', (time.perf_counter() - start) * 1000)
+        metrics.observe('paint_area_px', sum(rect.width() * rect.height() for rect in event.region().rects()))
 
-    def draw_lcd_background(self, config):
-        """Draw the LCD background for each clock element."""
+    def draw_atlas_elements(self, region):
+        """Blit the time from the glyph atlases for the elements inside the region."""
         painter = QPainter(self)
-        lcd_opacity = config['clock']['lcd_background_opacity']
-        
         for key, element in self.clock_elements.items():
-            label = element['label']
-            if label.isVisible():
-                painter.setFont(label.font())
-                color = QColor(*config['clock']['seconds_color'] if key == 'seconds' else config['clock']['color'])
-                painter.setPen(QColor(color.red(), color.green(), color.blue(), lcd_opacity))
-                rect = label.geometry()
-                background_text = '88' if key in ['hours', 'minutes', 'seconds'] else ':'
-                painter.drawText(rect, Qt.AlignCenter, background_text)
+            rect = element['rect']
+            if element['text'] and self.is_element_shown(key) and rect.intersects(QRectF(region)):
+                self.get_atlas(key).draw_text(painter, rect, element['text'])
+
+    def draw_lcd_background(self, clock):
+        """Composite the cached LCD background, rendering it first if it is stale."""
+        geometry = self.get_lcd_geometry()
+        if self.lcd_cache is None or self.lcd_cache_geometry != geometry:
+            self.lcd_cache = self.render_lcd_background(clock, geometry)
+            self.lcd_cache_geometry = geometry
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.lcd_cache)
+
+    def get_lcd_geometry(self):
+        """Return the pixel ratio, size and element rects the LCD background depends on."""
+        rects = []
+        for key, element in self.clock_elements.items():
+            if self.is_element_shown(key):
+                rect = element['rect'] if self.render_mode == 'atlas' else QRectF(element['label'].geometry())
+                rects.append((key, rect.getRect()))
+        return (self.devicePixelRatioF(), self.width(), self.height(), tuple(rects))
+
+    def render_lcd_background(self, clock, geometry):
+        """Render the '88', ':' and '.' ghost segments for each clock element into a pixmap."""
+        ratio, width, height, rects = geometry
+        pixmap = QPixmap(max(1, math.ceil(width * ratio)), max(1, math.ceil(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        lcd_opacity = clock.lcd_background_opacity
+        for key, rect in rects:
+            if self.render_mode == 'atlas':
+                font = self.get_atlas(key).font
+            else:
+                font = self.clock_elements[key]['label'].font()
+            painter.setFont(font)
+            color = clock.qcolor('seconds_color' if key in self.SECONDS_KEYS else 'color')
+            painter.setPen(QColor(color.red(), color.green(), color.blue(), lcd_opacity))
+            painter.drawText(QRectF(*rect), Qt.AlignCenter, self.get_ghost_text(key))
+        painter.end()
+        return pixmap
+
+    def invalidate_lcd_background(self):
+        """Drop the cached LCD background so it is re-rendered on the next paint."""
+        self.lcd_cache = None
+
+    def release(self):
+        """Stop updating and following configuration changes, so the widget can be destroyed."""
+        self.config_manager.unsubscribe(self.apply_changes)
+        if self.owns_timer:
+            self.timer.stop()
+        if self.frame_loop is not None:
+            self.frame_loop.stop()
 
     def update_config(self):
         """Update the widget's style and time display after a configuration change."""
         self.update_style()
+        if self.timer is not None:
+            self.update_frame_loop()
         self.update_time()
 
     def resizeEvent(self, event):
         """Handle the resize event and adjust layout."""
         super().resizeEvent(event)
+        self.invalidate_lcd_background()
         self.adjust_layout()
+        self.display_changed.emit()
 
-    def calculate_stretch_factors(self, show_seconds):
-        char_widths = {'hours': 2, 'separator': 1, 'minutes': 2, 'seconds': 2}
-        total_width = sum(char_widths.values()) + (1 if show_seconds else -2)  # -2 for removing seconds and one separator
-        
-        factors = {}
-        factors['hours'] = int(char_widths['hours'] / total_width * 100)
-        factors['separator1'] = int(char_widths['separator'] / total_width * 100)
-        factors['minutes'] = int(char_widths['minutes'] / total_width * 100)
-        
-        if show_seconds:
-            factors['separator2'] = int(char_widths['separator'] / total_width * 100)
-            factors['seconds'] = int(char_widths['seconds'] / total_width * 100)
-        else:
-            factors['separator2'] = 0
-            factors['seconds'] = 0
-        
-        return factors
+    def set_auto_fit(self, auto_fit):
+        """Switch between fitted and fixed font sizes."""
+        self.auto_fit = auto_fit
+        self.fit_sizes = None
+        for element in self.clock_elements.values():
+            # Fitted labels must not hold the window at their text size; (0, 0) restores the size hint
+            element['label'].setMinimumSize(1 if auto_fit else 0, 1 if auto_fit else 0)
+
+    def fit_fonts(self, clock):
+        """Size the fonts to fill the contents area and return stretch factors from the measured widths."""
+        area = self.get_contents_area()
+        texts = tuple((key, self.get_ghost_text(key), key in self.SECONDS_KEYS)
+                      for key in self.clock_elements if self.is_element_shown(key))
+        sizes, widths = font_metrics_cache.fit(clock.derived('main_font'), clock.derived('seconds_font'),
+                                               self, texts, area.width(), area.height())
+        if sizes != self.fit_sizes:
+            self.fit_sizes = sizes
+            if self.render_mode == 'atlas':
+                self.update_glyph_atlases(clock)
+            else:
+                for key, element in self.clock_elements.items():
+                    self.apply_font(clock, element['label'], key)
+            self.invalidate_lcd_background()
+        return {key: round(widths.get(key, 0)) for key in self.clock_elements}
+
+    def calculate_stretch_factors(self, show_seconds, fraction_digits):
+        char_widths = {'hours': 2, 'separator1': 1, 'minutes': 2, 'separator2': 1, 'seconds': 2,
+                       'separator3': 1, 'fraction': fraction_digits}
+        if not show_seconds:
+            for key in ('separator2', 'seconds', 'separator3', 'fraction'):
+                char_widths[key] = 0
+        elif not fraction_digits:
+            char_widths['separator3'] = 0
+        total_width = sum(char_widths.values())
+
+        return {key: int(width / total_width * 100) for key, width in char_widths.items()}
 
     def adjust_layout(self):
         """
@@ -162,14 +482,23 @@ class ClockWidget(QWidget):
         This method sets the stretch factors for each element in the layout
         to ensure they maintain proper proportions and fill the entire width.
         """
-        config = self.config_manager.get_config()
-        show_seconds = config['clock']['show_seconds']
-
-        stretch_factors = self.calculate_stretch_factors(show_seconds)
+        clock = self.config_manager.model.clock
+        if clock.auto_fit != self.auto_fit:
+            self.set_auto_fit(clock.auto_fit)
+        if self.auto_fit:
+            stretch_factors = self.fit_fonts(clock)
+        else:
+            cache_key = (clock.show_seconds, self.fraction_digits)
+            stretch_factors = self.stretch_factor_cache.get(cache_key)
+            if stretch_factors is None:
+                stretch_factors = self.stretch_factor_cache[cache_key] = self.calculate_stretch_factors(*cache_key)
 
         layout = self.layout()
         for i, (key, element) in enumerate(self.clock_elements.items()):
             layout.setStretch(i, stretch_factors[key])
 
+        if self.render_mode == 'atlas':
+            self.layout_atlas_elements()
+
         self.update()
         
\ No newline at end of file
@@ -1,5 +1,17 @@
 from PyQt5.QtWidgets import QPushButton
-from PyQt5.QtGui import QColor
+from .style_cache import style_cache
+
+def build_color_button_stylesheet(hex_color, text_color):
+    """Return the stylesheet of a color button showing the given color."""
+    return f"""
+            background-color: {hex_color};
+            color: {text_color};
+            border: 1px solid #bdc3c7;
+            border-radius: 4px;
+            padding: 5px;
+            font-family: monospace;
+            font-size: 12px;
+        """
 
 class ColorButton(QPushButton):
     """A custom button for color selection."""
@@ -15,15 +27,8 @@ class ColorButton(QPushButton):
         hex_color = color.name().upper()
         text_color = "#FFFFFF" if self.get_contrast_ratio(color) < 4.5 else "#000000"
         self.setText(hex_color)
-        self.setStyleSheet(f"""
-            background-color: {hex_color};
-            color: {text_color};
-            border: 1px solid #bdc3c7;
-            border-radius: 4px;
-            padding: 5px;
-            font-family: monospace;
-            font-size: 12px;
-        """)
+        # Buttons showing the same color share one stylesheet string
+        style_cache.apply_stylesheet(self, build_color_button_stylesheet, hex_color, text_color)
 
     def get_contrast_ratio(self, color):
         """Calculate the contrast ratio for determining text color."""
@@ -0,0 +1,69 @@
+from PyQt5.QtGui import QFont, QFontMetricsF
+
+# Largest point size the clock is fitted to
+MAX_POINT_SIZE = 1000
+# Point size the texts are measured at before scaling them to the widget
+REFERENCE_POINT_SIZE = 100
+# Share of the available area the fitted text may use
+FIT_MARGIN = 0.98
+
+class FontMetricsCache:
+    """Measured element sizes per font, point size, pixel ratio and set of shown elements."""
+
+    # Font and display changes add entries; resizing does not
+    MAX_ENTRIES = 64
+
+    def __init__(self):
+        self.measurements = {}
+
+    def measure(self, main_font, seconds_font, device, texts):
+        """Return ({element key: width}, height) for texts drawn with the given fonts.
+
+        texts is a tuple of (element key, text, uses seconds font) for the
+        shown elements. Digits are measured at the widest digit's advance,
+        like the glyph atlas, so the layout does not change with the time.
+        """
+        key = (main_font.key(), seconds_font.key(), device.devicePixelRatioF(), texts)
+        measurement = self.measurements.get(key)
+        if measurement is None:
+            if len(self.measurements) >= self.MAX_ENTRIES:
+                self.measurements.clear()
+            metrics = {False: QFontMetricsF(main_font, device), True: QFontMetricsF(seconds_font, device)}
+            digit_widths = {role: max(font_metrics.horizontalAdvance(digit) for digit in '0123456789')
+                            for role, font_metrics in metrics.items()}
+            widths = {}
+            for element_key, text, seconds_role in texts:
+                font_metrics = metrics[seconds_role]
+                widths[element_key] = sum(digit_widths[seconds_role] if char.isdigit() else font_metrics.horizontalAdvance(char)
+                                          for char in text)
+            height = max(font_metrics.height() for font_metrics in metrics.values())
+            measurement = self.measurements[key] = (widths, height)
+        return measurement
+
+    def fit(self, main_font, seconds_font, device, texts, width, height):
+        """Return the largest (main size, seconds size) whose texts fit width x height, and their widths.
+
+        The texts are measured once at REFERENCE_POINT_SIZE and scaled to the
+        available area, so refitting on resize only does arithmetic. The
+        seconds font keeps its size relative to the main font.
+        """
+        seconds_scale = seconds_font.pointSizeF() / max(1.0, main_font.pointSizeF())
+        widths, text_height = self.measure(self.resize_font(main_font, REFERENCE_POINT_SIZE),
+                                           self.resize_font(seconds_font, max(1, round(REFERENCE_POINT_SIZE * seconds_scale))),
+                                           device, texts)
+        total_width = sum(widths.values())
+        scale = min(width / total_width if total_width else 1.0, height / text_height if text_height else 1.0)
+        # Hinting makes advances grow slightly faster than the point size at small sizes
+        size = max(1, min(MAX_POINT_SIZE, int(REFERENCE_POINT_SIZE * scale * FIT_MARGIN)))
+        factor = size / REFERENCE_POINT_SIZE
+        return (size, max(1, round(size * seconds_scale))), {key: value * factor for key, value in widths.items()}
+
+    @staticmethod
+    def resize_font(font, point_size):
+        """Return a copy of font with another point size."""
+        font = QFont(font)
+        font.setPointSize(point_size)
+        return font
+
+# Measurements are shared by all clocks
+font_metrics_cache = FontMetricsCache()
@@ -0,0 +1,178 @@
+import threading
+from PyQt5.QtWidgets import QComboBox
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from utils.font_manager import font_manager
+from utils.memory_report import memory_report
+
+class FontListModel(QAbstractListModel):
+    """A shared list of font families that is enumerated once and exposed in batches."""
+
+    BATCH_SIZE = 200
+
+    families_ready = pyqtSignal(object)
+
+    def __init__(self, load_families, threaded):
+        """Initialize the model; with threaded=True load_families runs on a worker thread."""
+        super().__init__()
+        self.load_families = load_families
+        self.threaded = threaded
+        self.families = None
+        self.rows = {}
+        self.fetched = 0
+        self.loading = False
+        self.loaded_callbacks = []
+        # Delivered on the GUI thread, also when emitted by the loader thread
+        self.families_ready.connect(self.set_families)
+
+    def ensure_loaded(self):
+        """Enumerate the font families right away if they are not known yet."""
+        if self.families is None:
+            self.set_families(list(self.load_families()))
+
+    def load_async(self):
+        """Enumerate the font families outside the current call, e.g. the opening of a dialog."""
+        if self.families is not None or self.loading:
+            return
+        self.loading = True
+        if self.threaded:
+            threading.Thread(target=lambda: self.families_ready.emit(list(self.load_families())),
+                             name='font-list', daemon=True).start()
+        else:
+            QTimer.singleShot(0, lambda: self.families_ready.emit(list(self.load_families())))
+
+    def set_families(self, families):
+        """Take over the enumerated families and run the callbacks waiting for them."""
+        self.loading = False
+        if self.families is None:
+            self.families = families
+            self.rows = {family: row for row, family in enumerate(families)}
+        callbacks, self.loaded_callbacks = self.loaded_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def when_loaded(self, callback):
+        """Call callback once the families are enumerated, starting the enumeration if needed."""
+        if self.families is not None:
+            callback()
+            return
+        self.loaded_callbacks.append(callback)
+        self.load_async()
+
+    def reload(self):
+        """Forget the enumerated families so they are read again when next needed."""
+        self.beginResetModel()
+        self.families = None
+        self.rows = {}
+        self.fetched = 0
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.fetched
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.families[index.row()]
+        return None
+
+    def canFetchMore(self, parent):
+        if parent.isValid():
+            return False
+        if self.families is None:
+            # Rows appear once the asynchronous enumeration has finished
+            self.when_loaded(self.preload)
+            return False
+        return self.fetched < len(self.families)
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        count = min(self.BATCH_SIZE, len(self.families) - self.fetched)
+        self.beginInsertRows(QModelIndex(), self.fetched, self.fetched + count - 1)
+        self.fetched += count
+        self.endInsertRows()
+
+    def find_family(self, family):
+        """Return the row of a family, fetching rows up to it if needed, or -1."""
+        self.ensure_loaded()
+        row = self.rows.get(family, -1)
+        while self.fetched <= row:
+            self.fetchMore(QModelIndex())
+        return row
+
+    def preload(self):
+        """Enumerate the families in the background and expose them one batch per event loop pass."""
+        if self.families is None:
+            self.when_loaded(self.preload)
+        elif self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+            QTimer.singleShot(0, self.preload)
+
+font_models = {}
+
+def get_font_model(use_custom_fonts):
+    """Return the shared model of custom or system font families."""
+    key = 'custom' if use_custom_fonts else 'system'
+    if key not in font_models:
+        if use_custom_fonts:
+            # Listed from the font index; a font is registered once it is selected and used
+            font_models[key] = FontListModel(font_manager.get_custom_fonts, threaded=False)
+        else:
+            # The font database is guarded by a mutex in Qt, so it can be listed on a worker thread
+            font_models[key] = FontListModel(font_manager.get_system_fonts, threaded=True)
+    return font_models[key]
+
+def release_font_models():
+    """Drop the shared font models; they are enumerated again when next needed."""
+    font_models.clear()
+
+def preload_font_models():
+    """Fill both shared font models in the background of the event loop."""
+    for use_custom_fonts in (True, False):
+        get_font_model(use_custom_fonts).preload()
+
+memory_report.add_probe('font_list_entries', lambda: sum(
+    len(model.families) for model in font_models.values() if model.families is not None))
+
+class FontComboBox(QComboBox):
+    """A font family combo box backed by a shared FontListModel."""
+
+    currentFontChanged = pyqtSignal(QFont)
+
+    def __init__(self):
+        super().__init__()
+        self.view().setUniformItemSizes(True)
+        # Set while a new model fills in its rows, which selects row 0 on its own
+        self.selection_pending = False
+        self.currentIndexChanged.connect(self.emit_current_font)
+
+    def set_font_model(self, model):
+        """Show the families of the given shared model; changes are not reported until select_family."""
+        if self.model() is not model:
+            self.selection_pending = True
+            self.setModel(model)
+
+    def select_family(self, family, announce):
+        """Select a family and report changes again; with announce=True the selection is reported as a change."""
+        self.selection_pending = False
+        blocked = self.blockSignals(True)
+        self.setCurrentFont(QFont(family))
+        self.blockSignals(blocked)
+        if announce:
+            self.emit_current_font(self.currentIndex())
+
+    def emit_current_font(self, index):
+        if index >= 0 and not self.selection_pending:
+            self.currentFontChanged.emit(self.currentFont())
+
+    def currentFont(self):
+        return QFont(self.currentText())
+
+    def setCurrentFont(self, font):
+        row = self.model().find_family(font.family()) if isinstance(self.model(), FontListModel) else -1
+        if row >= 0:
+            self.setCurrentIndex(row)
+
+    def has_family(self, family):
+        """Return True if the current model lists the family."""
+        return isinstance(self.model(), FontListModel) and self.model().find_family(family) >= 0
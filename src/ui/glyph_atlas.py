@@ -0,0 +1,84 @@
+import math
+import weakref
+from PyQt5.QtCore import Qt, QRectF, QPointF
+from PyQt5.QtGui import QPixmap, QPainter, QFontMetricsF
+from utils.memory_report import memory_report
+
+class GlyphAtlas:
+    """A single pixmap holding pre-rasterized clock glyphs for one font, color and pixel ratio."""
+
+    CHARACTERS = '0123456789:.'
+
+    def __init__(self, font, color, device_pixel_ratio):
+        """Rasterize every clock character into the atlas pixmap."""
+        self.font = font
+        self.color = color
+        self.device_pixel_ratio = device_pixel_ratio
+        self.key = self.make_key(font, color, device_pixel_ratio)
+        self.glyph_rects = {}
+        self.rasterize()
+
+    @staticmethod
+    def make_key(font, color, device_pixel_ratio):
+        """Return the cache key for a font, color and pixel ratio combination."""
+        return (font.key(), color.rgba(), device_pixel_ratio)
+
+    def rasterize(self):
+        """Draw all characters side by side into one transparent pixmap."""
+        metrics = QFontMetricsF(self.font)
+        self.height = math.ceil(metrics.height())
+        self.advances = {char: math.ceil(metrics.horizontalAdvance(char)) for char in self.CHARACTERS}
+        # Digits share one cell width so the layout does not jitter between seconds
+        self.digit_width = max(self.advances[char] for char in '0123456789')
+
+        ratio = self.device_pixel_ratio
+        total_width = sum(self.cell_width(char) for char in self.CHARACTERS)
+        self.pixmap = QPixmap(max(1, math.ceil(total_width * ratio)), max(1, math.ceil(self.height * ratio)))
+        self.pixmap.setDevicePixelRatio(ratio)
+        self.pixmap.fill(Qt.transparent)
+
+        painter = QPainter(self.pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(self.font)
+        painter.setPen(self.color)
+        x = 0
+        for char in self.CHARACTERS:
+            width = self.cell_width(char)
+            painter.drawText(QRectF(x, 0, width, self.height), Qt.AlignCenter, char)
+            # Source rects are in device pixels
+            self.glyph_rects[char] = QRectF(x * ratio, 0, width * ratio, self.height * ratio)
+            x += width
+        painter.end()
+
+    def cell_width(self, char):
+        """Return the logical width reserved for a character."""
+        return self.digit_width if char.isdigit() else self.advances[char]
+
+    def text_width(self, text):
+        """Return the logical width of a string drawn from the atlas."""
+        return sum(self.cell_width(char) for char in text)
+
+    def draw_text(self, painter, rect, text):
+        """Blit a string from the atlas, centered in the given rect."""
+        x = rect.x() + (rect.width() - self.text_width(text)) / 2
+        y = rect.y() + (rect.height() - self.height) / 2
+        for char in text:
+            source = self.glyph_rects.get(char)
+            if source is not None:
+                painter.drawPixmap(QPointF(x, y), self.pixmap, source)
+            x += self.cell_width(char)
+
+# Atlases are shared by every clock drawing with the same font, color and pixel ratio
+shared_atlases = weakref.WeakValueDictionary()
+
+memory_report.add_probe('glyph_atlas_bytes', lambda: sum(
+    atlas.pixmap.width() * atlas.pixmap.height() * atlas.pixmap.depth() // 8 for atlas in list(shared_atlases.values())))
+
+def get_glyph_atlas(font, color, device_pixel_ratio):
+    """Return the shared atlas for a font, color and pixel ratio, rasterizing it if needed."""
+    key = GlyphAtlas.make_key(font, color, device_pixel_ratio)
+    atlas = shared_atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, device_pixel_ratio)
+        shared_atlases[key] = atlas
+    return atlas
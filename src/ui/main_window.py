@@ -1,22 +1,41 @@
 from PyQt5.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QMenu, QMessageBox, QSizeGrip
-from PyQt5.QtCore import Qt, QPoint, QRect
-from PyQt5.QtGui import QColor, QGuiApplication
+from PyQt5.QtCore import Qt, QRect, QRectF
+from PyQt5.QtGui import QPainter, QPainterPath, QPixmap, QPixmapCache
+from utils.font_manager import font_manager
 from .clock_widget import ClockWidget
-from .settings_window import SettingsWindow
-from utils.utils import rgba_to_string
+from .window_dragger import WindowDragger
+
+MENU_STYLESHEET = """
+    QMenu {
+        background-color: white;
+        color: black;
+    }
+    QMenu::item:selected {
+        background-color: #0078d7;
+        color: white;
+    }
+"""
 
 class MainWindow(QMainWindow):
     """The main window of the desktop clock application."""
 
-    def __init__(self, config_manager):
-        """Initialize the main window."""
+    def __init__(self, config_manager, primary=True):
+        """Initialize the main window.
+
+        Only the primary window restores and saves the stored geometry;
+        additional windows are released when they close.
+        """
         super().__init__()
         self.config_manager = config_manager
-        self.draggable = False
-        self.offset = QPoint()
+        self.primary = primary
+        self.dragger = WindowDragger(self)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.resizable = False
         self.size_grip = None
+        self.settings_window = None
+        self.stats_overlay = None
+        self.background_cache = None
+        self.background_cache_key = None
         self.init_ui()
     
     def init_ui(self):
@@ -24,6 +43,8 @@ class MainWindow(QMainWindow):
         self.central_widget = QWidget(self)
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
+        # The rounded background is painted in paintEvent; the stylesheet only styles the menu
+        self.setStyleSheet(MENU_STYLESHEET)
         
         self.clock_widget = ClockWidget(self.config_manager)
         self.main_layout.addWidget(self.clock_widget)
@@ -33,40 +54,13 @@ class MainWindow(QMainWindow):
         
         self.load_geometry()
         self.update_style()
+        self.config_manager.subscribe(self.apply_changes, [('main_window', None)])
 
     def update_style(self):
         """Update the style of the main window based on the current configuration."""
-        config = self.config_manager.get_config()
-        if config['main_window']['frameless']:
-            self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
-        else:
-            self.setWindowFlags(self.windowFlags() & ~Qt.FramelessWindowHint)
-        
-        bg_color = QColor(*config['main_window']['background_color'])
-        corner_radius = config['main_window']['corner_radius']
-        background_margin = config['main_window']['background_margin']
-        
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {rgba_to_string(bg_color.getRgb())};
-                border-radius: {corner_radius}px;
-            }}
-            QWidget#centralWidget {{
-                background-color: {rgba_to_string(bg_color.getRgb())};
-                border-radius: {corner_radius}px;
-            }}
-            QMenu {{
-                background-color: white;
-                color: black;
-            }}
-            QMenu::item:selected {{
-                background-color: #0078d7;
-                color: white;
-            }}
-        """)
-        
-        self.central_widget.setObjectName("centralWidget")
-        self.main_layout.setContentsMargins(background_margin, background_margin, background_margin, background_margin)
+        config = self.config_manager.model.main_window
+        self.apply_window_flags(config)
+        self.apply_window_style(config)
         self.clock_widget.update_config()
         self.show()  # Necessary to apply changes
         
@@ -76,10 +70,69 @@ class MainWindow(QMainWindow):
         # Update size grip visibility
         self.update_size_grip()
 
+    def apply_changes(self, changes):
+        """Apply only the parts of the window style touched by a main window change-set."""
+        config = self.config_manager.model.main_window
+        keys = {change.key for change in changes}
+        if 'frameless' in keys:
+            self.apply_window_flags(config)
+            self.update_cursor()
+            self.update_size_grip()
+        if keys & {'background_color', 'corner_radius', 'background_margin'}:
+            self.apply_window_style(config)
+        if 'geometry' in keys and config.geometry != list(self.geometry().getRect()):
+            self.load_geometry()
+
+    def apply_window_flags(self, config):
+        """Set the frameless hint, recreating the native window only if it actually changes."""
+        if config.frameless:
+            flags = self.windowFlags() | Qt.FramelessWindowHint
+        else:
+            flags = self.windowFlags() & ~Qt.FramelessWindowHint
+        if flags != self.windowFlags():
+            self.setWindowFlags(flags)
+            self.show()  # Changing window flags hides the window
+
+    def apply_window_style(self, config):
+        """Apply the background color, corner radius and margin of the main window."""
+        background_margin = config.background_margin
+        self.main_layout.setContentsMargins(background_margin, background_margin, background_margin, background_margin)
+        self.background_cache = None
+        self.update()
+
+    def paintEvent(self, event):
+        """Composite the cached rounded background."""
+        key = (self.width(), self.height(), self.devicePixelRatioF())
+        if self.background_cache is None or self.background_cache_key != key:
+            self.background_cache = self.render_background(*key)
+            self.background_cache_key = key
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.background_cache)
+
+    def render_background(self, width, height, ratio):
+        """Render the rounded window background for a size and pixel ratio into a pixmap."""
+        config = self.config_manager.model.main_window
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(height * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, width, height), config.corner_radius, config.corner_radius)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillPath(path, config.qcolor('background_color'))
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        """Drop the cached background when the window size changes."""
+        super().resizeEvent(event)
+        self.background_cache = None
+
     def update_cursor(self):
         """Update the cursor based on the current window state."""
-        config = self.config_manager.get_config()
-        if config['main_window']['frameless']:
+        config = self.config_manager.model.main_window
+        if config.frameless:
             self.setCursor(Qt.OpenHandCursor if not self.resizable else Qt.ArrowCursor)
         else:
             self.setCursor(Qt.ArrowCursor)
@@ -102,10 +155,17 @@ class MainWindow(QMainWindow):
         about_action = menu.addAction("About")
         
         # Add toggle resize action
-        config = self.config_manager.get_config()
-        if config['main_window']['frameless']:
+        config = self.config_manager.model.main_window
+        if config.frameless:
             resize_action = menu.addAction("Enable Resizing" if not self.resizable else "Disable Resizing")
         
+        stopwatch_shown = self.config_manager.model.clock.display_mode == 'stopwatch'
+        if stopwatch_shown:
+            stopwatch_action = menu.addAction("Stop Stopwatch" if self.clock_widget.stopwatch.running else "Start Stopwatch")
+            reset_action = menu.addAction("Reset Stopwatch")
+
+        stats_shown = self.stats_overlay is not None and self.stats_overlay.isVisible()
+        stats_action = menu.addAction("Hide Performance Stats" if stats_shown else "Show Performance Stats")
         exit_action = menu.addAction("Exit")
         
         action = menu.exec_(self.mapToGlobal(position))
@@ -113,16 +173,29 @@ class MainWindow(QMainWindow):
             self.open_settings()
         elif action == about_action:
             self.show_about_dialog()
-        elif config['main_window']['frameless'] and action == resize_action:
+        elif config.frameless and action == resize_action:
             self.toggle_resize()
+        elif stopwatch_shown and action == stopwatch_action:
+            self.clock_widget.toggle_stopwatch()
+        elif stopwatch_shown and action == reset_action:
+            self.clock_widget.reset_stopwatch()
+        elif action == stats_action:
+            self.toggle_stats_overlay()
         elif action == exit_action:
             self.close()
 
+    def toggle_stats_overlay(self):
+        """Show or hide the performance metrics overlay."""
+        if self.stats_overlay is None:
+            from .stats_overlay import StatsOverlay
+            self.stats_overlay = StatsOverlay(self.central_widget, self.clock_widget)
+        self.stats_overlay.set_active(not self.stats_overlay.isVisible())
+
     def toggle_resize(self):
         """Toggle the resizability of the window."""
-        config = self.config_manager.get_config()
+        config = self.config_manager.model.main_window
         
-        if config['main_window']['frameless']:
+        if config.frameless:
             self.resizable = not self.resizable            
             if self.resizable:
                 self.setWindowFlags(self.windowFlags() & ~Qt.FramelessWindowHint)
@@ -133,10 +206,29 @@ class MainWindow(QMainWindow):
             self.show()  # Necessary to apply changes after updating window flags
 
     def open_settings(self):
-        """Open the settings window."""
-        settings_window = SettingsWindow(self.config_manager)
-        settings_window.settings_changed.connect(self.update_style)
-        settings_window.exec_()
+        """Open the settings window, building it on first use."""
+        if self.settings_window is not None and self.settings_window.isVisible():
+            self.settings_window.raise_()
+            self.settings_window.activateWindow()
+            return
+        if self.settings_window is None:
+            # Imported here so the settings machinery stays out of startup
+            from .settings_window import SettingsWindow
+            self.settings_window = SettingsWindow(self.config_manager)
+        else:
+            self.settings_window.load_settings()
+        self.settings_window.exec_()
+        if self.config_manager.model.main_window.low_memory:
+            self.release_settings()
+
+    def release_settings(self):
+        """Free the settings window, its font lists and the fonts registered while browsing them."""
+        from .font_model import release_font_models
+        self.settings_window.deleteLater()
+        self.settings_window = None
+        release_font_models()
+        font_manager.release_unused_fonts({self.config_manager.model.clock.font})
+        QPixmapCache.clear()
 
     def show_about_dialog(self):
         """Show the about dialog."""
@@ -145,47 +237,45 @@ class MainWindow(QMainWindow):
     def mousePressEvent(self, event):
         """Handle mouse press events for window dragging."""
         if event.button() == Qt.LeftButton:
-            self.draggable = True
-            self.offset = event.pos()
-            if self.config_manager.get_config()['main_window']['frameless'] and not self.resizable:
+            config = self.config_manager.model.main_window
+            if config.frameless and not self.resizable:
+                # Keep the window inside the screen by the corner radius and background margin
+                inset = config.corner_radius + config.background_margin
+                self.dragger.begin(event.pos(), event.globalPos(), inset)
                 self.setCursor(Qt.ClosedHandCursor)  # Change cursor to indicate grabbing
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events for window dragging."""
-        if self.draggable and self.config_manager.get_config()['main_window']['frameless'] and not self.resizable:
-            config = self.config_manager.get_config()
-            corner_radius = config['main_window']['corner_radius']
-            background_margin = config['main_window']['background_margin']
-            
-            # Calculate the total offset including corner radius and background margin
-            total_offset_x = corner_radius + background_margin
-            total_offset_y = corner_radius + background_margin
-            
-            new_pos = self.mapToGlobal(event.pos() - self.offset)
-            screen_geo = QGuiApplication.primaryScreen().geometry()
-            
-            # Adjust the position to account for the corner radius and background margin
-            new_pos.setX(max(total_offset_x, min(new_pos.x(), screen_geo.width() - self.width() + total_offset_x)))
-            new_pos.setY(max(total_offset_y, min(new_pos.y(), screen_geo.height() - self.height() + total_offset_y)))
-            
-            self.move(new_pos)
+        self.dragger.drag_to(event.globalPos())
 
     def mouseReleaseEvent(self, event):
-        """Handle mouse release events for window dragging."""
+        """Handle mouse release events for window dragging and save the final position."""
         if event.button() == Qt.LeftButton:
-            self.draggable = False
+            if self.dragger.end():
+                self.save_geometry()
             self.update_cursor()
 
+    def save_geometry(self):
+        """Store the window geometry in the configuration."""
+        if self.primary:
+            self.config_manager.set_setting('main_window', 'geometry', list(self.geometry().getRect()))
+
     def closeEvent(self, event):
         """Handle the window close event."""
-        config = self.config_manager.get_config()
-        config['main_window']['geometry'] = self.geometry().getRect()
+        self.save_geometry()
         self.config_manager.save_config()
+        if not self.primary:
+            self.release()
         event.accept()
+
+    def release(self):
+        """Stop following configuration changes, so the window can be destroyed."""
+        self.config_manager.unsubscribe(self.apply_changes)
+        self.clock_widget.release()
         
     def load_geometry(self):
         """Load the window geometry from the configuration."""
-        config = self.config_manager.get_config()
-        geometry = config['main_window']['geometry']
-        if geometry:
+        config = self.config_manager.model.main_window
+        geometry = config.geometry
+        if geometry and self.primary:
             self.setGeometry(QRect(*geometry))
\ No newline at end of file
@@ -1,11 +1,12 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QSpinBox, QFontComboBox, QCheckBox, QGroupBox, 
                              QSlider, QComboBox, QColorDialog)
-from PyQt5.QtCore import pyqtSignal, Qt
-from PyQt5.QtGui import QFont, QColor, QFontDatabase
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtGui import QColor
 from utils.settings_definition import SETTINGS
 from utils.font_manager import font_manager
 from .color_button import ColorButton
+from .font_model import FontComboBox, get_font_model
 
 
 class SettingsWindow(QDialog):
@@ -122,7 +123,7 @@ class SettingsWindow(QDialog):
                     widget = ColorButton(QColor(*self.config_manager.get_setting(section, key)))
                     widget.clicked.connect(lambda checked, s=section, k=key, w=widget: self.open_color_dialog(s, k, w))
                 elif setting['widget'] == QFontComboBox:
-                    widget = QFontComboBox()
+                    widget = FontComboBox()
                     self.update_font_list(widget)
                     widget.currentFontChanged.connect(lambda font, s=section, k=key: self.save_font_setting(s, k, font))
                 elif setting['widget'] == QSlider:
@@ -154,17 +155,18 @@ class SettingsWindow(QDialog):
                 layout.addLayout(setting_layout)
 
     def load_settings(self):
-        """Load current settings into the UI widgets."""
+        """Load current settings into the UI widgets without saving them back."""
         for section in SETTINGS:
             for key, setting in SETTINGS[section].items():
                 if setting['widget'] is not None:
                     widget = getattr(self, f"{section}_{key}_widget")
                     value = self.config_manager.get_setting(section, key)
+                    widget.blockSignals(True)
                     
                     if isinstance(widget, QSpinBox):
                         widget.setValue(value)
-                    elif isinstance(widget, QFontComboBox):
-                        widget.setCurrentFont(QFont(value))
+                    elif isinstance(widget, FontComboBox):
+                        self.update_font_list(widget)
                     elif isinstance(widget, ColorButton):
                         widget.setColor(QColor(*value))
                     elif isinstance(widget, QCheckBox):
@@ -174,6 +176,8 @@ class SettingsWindow(QDialog):
                     elif isinstance(widget, QComboBox):
                         widget.setCurrentText(value)
 
+                    widget.blockSignals(False)
+
     def save_setting(self, section, key, value):
         """Save a setting and emit the settings_changed signal."""
         self.config_manager.set_setting(section, key, value)
@@ -181,9 +185,8 @@ class SettingsWindow(QDialog):
 
     def save_font_setting(self, section, key, font):
         font_family = font.family()
-        self.config_manager.set_setting(section, key, font_family)
         is_lcd_font = font_manager.is_lcd_font(font_family)
-        self.config_manager.set_setting(section, 'use_lcd_style', is_lcd_font)
+        self.config_manager.set_settings(section, {key: font_family, 'use_lcd_style': is_lcd_font})
         self.settings_changed.emit()
 
     def open_color_dialog(self, section, key, button):
@@ -195,26 +198,30 @@ class SettingsWindow(QDialog):
             self.save_setting(section, key, list(color.getRgb()))
             
     def update_font_list(self, widget):
+        """Point the font combo at the shared custom or system font model and select the configured font.
+
+        The families are enumerated after the dialog has opened, and the font
+        is selected once they are available.
+        """
         use_custom_fonts = self.config_manager.get_setting('clock', 'use_custom_fonts')
-        current_font = widget.currentFont().family()
-        widget.clear()
-        if use_custom_fonts:
-            for font in font_manager.get_custom_fonts():
-                widget.addItem(font)
-            if current_font not in font_manager.get_custom_fonts():
-                current_font = font_manager.get_custom_fonts()[0] if font_manager.get_custom_fonts() else ""
-        else:
-            widget.setWritingSystem(QFontDatabase.Any)
-            if current_font not in QFontDatabase().families():
-                current_font = QFontDatabase().families()[0]
-        
-        widget.setCurrentFont(QFont(current_font))
+        model = get_font_model(use_custom_fonts)
+        widget.set_font_model(model)
+        model.when_loaded(lambda: self.select_font(widget, model))
+
+    def select_font(self, widget, model):
+        """Select the configured font, or the first family if the model does not list it."""
+        if widget.model() is not model:
+            return
+        configured_font = self.config_manager.get_setting('clock', 'font')
+        if widget.has_family(configured_font):
+            # Showing the configured font is not a change to save
+            widget.select_family(configured_font, announce=False)
+        elif model.families:
+            widget.select_family(model.families[0], announce=True)
 
     def update_font_combo(self):
         font_widget = getattr(self, "clock_font_widget")
         self.update_font_list(font_widget)
-        current_font = self.config_manager.get_setting('clock', 'font')
-        font_widget.setCurrentFont(QFont(current_font))
 
     def update_seconds_font_size(self, value):
         """Ensure that seconds font size is not larger than the main font size."""
@@ -0,0 +1,45 @@
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import QTimer, Qt
+from utils.metrics import metrics
+from utils.memory_report import memory_report
+
+class StatsOverlay(QLabel):
+    """A small on-screen panel showing the live performance metrics."""
+
+    def __init__(self, parent, clock_widget):
+        super().__init__(parent)
+        self.clock_widget = clock_widget
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setStyleSheet("""
+            background-color: rgba(0, 0, 0, 180);
+            color: #7CFC00;
+            font-family: monospace;
+            font-size: 10px;
+            padding: 4px;
+        """)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def set_active(self, active):
+        """Show and start refreshing the overlay, or hide and stop it."""
+        if active:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.timer.start(1000)
+        else:
+            self.timer.stop()
+            self.hide()
+
+    def refresh(self):
+        """Redraw the overlay text from the current metrics."""
+        skew = self.clock_widget.get_skew_ms()
+        lines = [f"skew: last {skew['last']:.2f} ms, max {skew['max']:.2f} ms"]
+        frames = self.clock_widget.get_frame_stats()
+        if frames is not None:
+            lines.append(f"frames: {frames['fps']:.1f} fps, {frames['dropped']} of {frames['frames'] + frames['dropped']} dropped")
+        lines += metrics.summary_lines() + memory_report.summary_lines()
+        self.setText('\n'.join(lines))
+        self.adjustSize()
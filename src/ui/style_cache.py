@@ -0,0 +1,65 @@
+import weakref
+from PyQt5.QtGui import QPalette, QColor
+from utils.metrics import metrics
+from utils.memory_report import memory_report
+
+class StyleCache:
+    """Builds styles once per distinct set of inputs and skips re-applying unchanged ones."""
+
+    # Color schedules blend through many colors, so old palettes are dropped past this count
+    MAX_PALETTES = 256
+
+    def __init__(self):
+        self.palettes = {}
+        self.stylesheets = {}
+        self.applied = weakref.WeakKeyDictionary()
+        self.apply_count = 0
+
+    def get_palette(self, foreground, background):
+        """Return a shared palette for the given RGBA text and background colors."""
+        key = (tuple(foreground), tuple(background))
+        palette = self.palettes.get(key)
+        if palette is None:
+            if len(self.palettes) >= self.MAX_PALETTES:
+                self.palettes.clear()
+            palette = QPalette()
+            for role in (QPalette.WindowText, QPalette.Text):
+                palette.setColor(role, QColor(*foreground))
+            palette.setColor(QPalette.Window, QColor(*background))
+            self.palettes[key] = palette
+        return palette
+
+    def apply_palette(self, widget, foreground, background):
+        """Give a widget solid text and background colors without using a stylesheet."""
+        key = ('palette', tuple(foreground), tuple(background))
+        if self.applied.get(widget) == key:
+            return False
+        widget.setPalette(self.get_palette(foreground, background))
+        widget.setAutoFillBackground(True)
+        self.applied[widget] = key
+        self.apply_count += 1
+        metrics.increment('palette_applies')
+        return True
+
+    def get_stylesheet(self, build, *args):
+        """Return the stylesheet produced by build(*args), building it only once."""
+        key = (build, args)
+        stylesheet = self.stylesheets.get(key)
+        if stylesheet is None:
+            stylesheet = self.stylesheets[key] = build(*args)
+        return stylesheet
+
+    def apply_stylesheet(self, widget, build, *args):
+        """Set the stylesheet produced by build(*args) unless the widget already has it."""
+        key = ('stylesheet', build, args)
+        if self.applied.get(widget) == key:
+            return False
+        widget.setStyleSheet(self.get_stylesheet(build, *args))
+        self.applied[widget] = key
+        self.apply_count += 1
+        metrics.increment('stylesheet_applies')
+        return True
+
+style_cache = StyleCache()
+memory_report.add_probe('palettes', lambda: len(style_cache.palettes))
+memory_report.add_probe('stylesheets', lambda: len(style_cache.stylesheets))
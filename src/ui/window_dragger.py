@@ -0,0 +1,71 @@
+from PyQt5.QtCore import QObject, QTimer, QPoint, Qt
+from PyQt5.QtGui import QGuiApplication
+
+class WindowDragger(QObject):
+    """Moves a window with the mouse, clamped to the screen under the cursor, at most once per frame."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.offset = QPoint()
+        self.inset = 0
+        self.screen_geometry = None
+        self.pending_pos = None
+        self.active = False
+        self.moved = False
+        self.move_timer = QTimer(self)
+        self.move_timer.setSingleShot(True)
+        self.move_timer.setTimerType(Qt.PreciseTimer)
+        self.move_timer.timeout.connect(self.apply_move)
+
+    def begin(self, offset, global_pos, inset):
+        """Start dragging with the cursor at offset inside the window.
+
+        inset keeps the window that far inside the screen edges, to account
+        for the corner radius and background margin.
+        """
+        self.active = True
+        self.moved = False
+        self.offset = offset
+        self.inset = inset
+        self.update_screen(global_pos)
+
+    def update_screen(self, global_pos):
+        """Cache the geometry and frame interval of the screen under the cursor."""
+        screen = QGuiApplication.screenAt(global_pos) or QGuiApplication.primaryScreen()
+        self.screen_geometry = screen.geometry()
+        refresh_rate = screen.refreshRate() or 60
+        self.move_timer.setInterval(max(1, int(1000 / refresh_rate)))
+
+    def drag_to(self, global_pos):
+        """Queue a move so the cursor stays at the grab offset; moves are applied once per frame."""
+        if not self.active:
+            return
+        if not self.screen_geometry.contains(global_pos):
+            self.update_screen(global_pos)
+
+        geometry = self.screen_geometry
+        new_pos = global_pos - self.offset
+        new_pos.setX(max(geometry.left() + self.inset,
+                         min(new_pos.x(), geometry.left() + geometry.width() - self.window.width() + self.inset)))
+        new_pos.setY(max(geometry.top() + self.inset,
+                         min(new_pos.y(), geometry.top() + geometry.height() - self.window.height() + self.inset)))
+        self.pending_pos = new_pos
+        if not self.move_timer.isActive():
+            self.move_timer.start()
+
+    def apply_move(self):
+        """Move the window to the most recent queued position."""
+        if self.pending_pos is not None:
+            self.window.move(self.pending_pos)
+            self.pending_pos = None
+            self.moved = True
+
+    def end(self):
+        """Finish the drag, applying any queued move. Returns True if the window was moved."""
+        if not self.active:
+            return False
+        self.active = False
+        self.move_timer.stop()
+        self.apply_move()
+        return self.moved
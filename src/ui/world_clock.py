@@ -0,0 +1,93 @@
+import math
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from PyQt5.QtWidgets import QWidget, QGridLayout, QVBoxLayout, QLabel, QMenu
+from PyQt5.QtCore import Qt
+from utils.tick_scheduler import TickScheduler
+from utils.zone_offsets import ZoneOffsetCache
+from .clock_widget import ClockWidget
+from .style_cache import style_cache
+
+class WorldClockWindow(QWidget):
+    """A wall of clocks, one per time zone, driven by a single shared tick source."""
+
+    def __init__(self, config_manager):
+        """Initialize the world clock wall from the world_clock section of the configuration."""
+        super().__init__()
+        self.config_manager = config_manager
+        self.setWindowTitle("World Clock")
+        self.clocks = []
+        self.zone_names = []
+        self.scheduler = TickScheduler(self)
+        self.init_ui()
+        self.zone_offsets = ZoneOffsetCache(self.zone_names)
+        self.scheduler.tick.connect(self.update_clocks)
+        self.scheduler.follow_visibility(self)
+        self.update_tick_interval()
+        self.scheduler.start()
+        self.config_manager.subscribe(self.apply_changes, [('clock', 'show_seconds')])
+
+    def init_ui(self):
+        """Create a captioned clock for every configured time zone."""
+        config = self.config_manager.get_config()
+        zone_names = config['world_clock']['time_zones']
+        columns = config['world_clock']['columns'] or max(1, math.ceil(math.sqrt(len(zone_names))))
+
+        layout = QGridLayout(self)
+        layout.setSpacing(4)
+        for zone_name in zone_names:
+            try:
+                ZoneInfo(zone_name)
+            except (ZoneInfoNotFoundError, ValueError):
+                print(f"Warning: Unknown time zone {zone_name}")
+                continue
+            clock = ClockWidget(self.config_manager, tick_source=self.scheduler)
+            caption = QLabel(zone_name.split('/')[-1].replace('_', ' '))
+            caption.setAlignment(Qt.AlignCenter)
+            style_cache.apply_palette(caption, config['clock']['color'], config['clock']['background_color'])
+
+            cell = QVBoxLayout()
+            cell.setSpacing(0)
+            cell.addWidget(clock, 1)
+            cell.addWidget(caption)
+            index = len(self.clocks)
+            layout.addLayout(cell, index // columns, index % columns)
+            self.clocks.append(clock)
+            self.zone_names.append(zone_name)
+
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self.show_context_menu)
+
+    def update_tick_interval(self):
+        """Tick every second, or only on minute boundaries when seconds are hidden."""
+        show_seconds = self.config_manager.get_setting('clock', 'show_seconds')
+        self.scheduler.set_interval(1.0 if show_seconds else 60.0)
+
+    def apply_changes(self, changes):
+        """Follow changes to the seconds setting."""
+        self.update_tick_interval()
+
+    def update_clocks(self):
+        """Fan a tick out to every clock, converting the time once per distinct UTC offset."""
+        timestamp = self.scheduler.last_timestamp
+        offsets = self.zone_offsets.get_offsets(timestamp)
+        local_times = {}
+        for clock, offset in zip(self.clocks, offsets):
+            local_time = local_times.get(offset)
+            if local_time is None:
+                local_time = local_times[offset] = self.zone_offsets.get_local_time(timestamp, offset)
+            clock.update_time(local_time)
+
+    def show_context_menu(self, position):
+        """Show the context menu when right-clicking on the window."""
+        menu = QMenu(self)
+        exit_action = menu.addAction("Exit")
+        if menu.exec_(self.mapToGlobal(position)) == exit_action:
+            self.close()
+
+    def closeEvent(self, event):
+        """Stop the shared tick source and configuration updates when the wall is closed."""
+        self.scheduler.stop()
+        self.config_manager.unsubscribe(self.apply_changes)
+        for clock in self.clocks:
+            clock.release()
+        event.accept()
@@ -0,0 +1,152 @@
+import array
+from PyQt5.QtCore import QObject
+from .tick_scheduler import TickScheduler
+
+SECONDS_PER_DAY = 86400
+
+# Schedule keys in the color_schedules section and the color settings they drive
+SCHEDULE_TARGETS = {
+    'clock_color': ('clock', 'color'),
+    'clock_seconds_color': ('clock', 'seconds_color'),
+    'clock_background_color': ('clock', 'background_color'),
+    'main_window_background_color': ('main_window', 'background_color'),
+}
+
+def parse_time(value):
+    """Return the second of the day for an 'HH:MM' or 'HH:MM:SS' string."""
+    parts = [int(part) for part in str(value).split(':')]
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"expected HH:MM or HH:MM:SS, got {value!r}")
+    hours, minutes, seconds = (parts + [0])[:3]
+    if not (0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 60):
+        raise ValueError(f"time out of range: {value!r}")
+    return hours * 3600 + minutes * 60 + seconds
+
+def parse_keyframes(name, keyframes):
+    """Return the valid keyframes of a schedule as sorted (second of day, RGBA list) pairs."""
+    parsed = {}
+    for keyframe in keyframes:
+        try:
+            time_value, color = keyframe
+            color = [max(0, min(int(channel), 255)) for channel in color]
+            if len(color) == 3:
+                color.append(255)
+            if len(color) != 4:
+                raise ValueError("expected 3 or 4 color channels")
+            parsed[parse_time(time_value)] = color
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Ignoring keyframe {keyframe!r} of color schedule {name} ({str(e)})")
+    return sorted(parsed.items())
+
+def pack_color(color):
+    """Pack an RGBA list into one 0xRRGGBBAA integer."""
+    red, green, blue, alpha = color
+    return (red << 24) | (green << 16) | (blue << 8) | alpha
+
+def unpack_color(value):
+    """Unpack a 0xRRGGBBAA integer into an RGBA list."""
+    value = int(value)
+    return [(value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF]
+
+def compile_schedule(keyframes):
+    """Interpolate keyframes into a table of one packed RGBA value per second of the day.
+
+    Colors blend linearly between keyframes and wrap around midnight.
+    """
+    # Repeat the keyframes around the day so every second has a keyframe on either side
+    seconds = [second - SECONDS_PER_DAY for second, _ in keyframes[-1:]] + [second for second, _ in keyframes] \
+        + [second + SECONDS_PER_DAY for second, _ in keyframes[:1]]
+    colors = [color for _, color in keyframes[-1:]] + [color for _, color in keyframes] + [color for _, color in keyframes[:1]]
+
+    # NumPy is optional and slow to import, so it is only loaded once a schedule is compiled
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        day = numpy.arange(SECONDS_PER_DAY)
+        channels = [numpy.rint(numpy.interp(day, seconds, [color[channel] for color in colors])).astype(numpy.uint32)
+                    for channel in range(4)]
+        return (channels[0] << 24) | (channels[1] << 16) | (channels[2] << 8) | channels[3]
+
+    table = array.array('I', [0]) * SECONDS_PER_DAY
+    for index in range(len(seconds) - 1):
+        start, end = seconds[index], seconds[index + 1]
+        start_color, end_color = colors[index], colors[index + 1]
+        span = end - start
+        for second in range(max(start, 0), min(end, SECONDS_PER_DAY)):
+            position = (second - start) / span
+            table[second] = pack_color([round(a + (b - a) * position) for a, b in zip(start_color, end_color)])
+    return table
+
+class ColorScheduler(QObject):
+    """Drives the scheduled colors from per-second lookup tables compiled once per schedule."""
+
+    def __init__(self, config_manager, widget, parent=None):
+        """Initialize the scheduler; it ticks like the clock and pauses while widget is not visible."""
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.tables = {}
+        self.current = {}
+        self.timer = TickScheduler(self)
+        self.timer.tick.connect(self.update_colors)
+        self.timer.follow_visibility(widget)
+        self.update_tick_interval()
+        self.compile()
+        self.config_manager.subscribe(self.apply_changes, [('color_schedules', None)])
+        self.config_manager.subscribe(self.reapply, SCHEDULE_TARGETS.values())
+        self.config_manager.subscribe(lambda changes: self.update_tick_interval(), [('clock', 'show_seconds')])
+
+    def update_tick_interval(self):
+        """Change colors every second, or on minute boundaries when the clock hides seconds."""
+        self.timer.set_interval(1.0 if self.config_manager.model.clock.show_seconds else 60.0)
+
+    def compile(self):
+        """Build the lookup tables and run the tick source only while a schedule exists."""
+        schedules = self.config_manager.model.color_schedules
+        tables = {}
+        for name in SCHEDULE_TARGETS:
+            keyframes = parse_keyframes(name, getattr(schedules, name))
+            if keyframes:
+                tables[name] = compile_schedule(keyframes)
+        removed = set(self.tables) - set(tables)
+        self.tables = tables
+        for name in removed:
+            # The schedule was removed; go back to the stored color
+            section, key = SCHEDULE_TARGETS[name]
+            self.config_manager.override_settings(section, {key: self.config_manager.get_setting(section, key)})
+        if tables:
+            if not self.timer.paused:
+                # While paused, resuming starts the ticks
+                self.timer.start()
+        else:
+            self.timer.stop()
+
+    def apply_changes(self, changes):
+        """Recompile the tables after the schedules changed."""
+        self.current = {}
+        self.compile()
+
+    def reapply(self, changes):
+        """Put a scheduled color back after someone else changed its setting."""
+        targets = {target: name for name, target in SCHEDULE_TARGETS.items()}
+        for change in changes:
+            name = targets[(change.section, change.key)]
+            value = self.current.get(name)
+            if name not in self.tables or value is None or change.new_value == unpack_color(value):
+                continue  # Not scheduled, or our own override
+            self.set_color(name, value)
+
+    def update_colors(self, current_time):
+        """Look up the colors for this second and apply the ones that changed."""
+        second = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        for name, table in self.tables.items():
+            value = int(table[second])
+            if self.current.get(name) != value:
+                self.set_color(name, value)
+
+    def set_color(self, name, value):
+        """Apply a packed color to the setting a schedule drives."""
+        self.current[name] = value
+        section, key = SCHEDULE_TARGETS[name]
+        self.config_manager.override_settings(section, {key: unpack_color(value)})
@@ -1,25 +1,82 @@
+import atexit
+import copy
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
 import yaml
-from .settings_definition import get_default_config
+from .settings_definition import get_default_config, get_schema_hash
+from .config_model import ConfigModel, validate_config
+from .metrics import metrics
+
+# Prefer the libyaml C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 def tuple_constructor(loader, node):
     """Custom YAML constructor for handling tuples."""
     return list(loader.construct_sequence(node))
 
 yaml.SafeLoader.add_constructor('tag:yaml.org,2002:python/tuple', tuple_constructor)
+if YamlLoader is not yaml.SafeLoader:
+    YamlLoader.add_constructor('tag:yaml.org,2002:python/tuple', tuple_constructor)
+
+ConfigChange = namedtuple('ConfigChange', ['section', 'key', 'old_value', 'new_value'])
+
+def copy_file_mode(temp_path, path):
+    """Give a temporary file the permissions of the file it replaces, or 0644 for a new file."""
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    os.chmod(temp_path, mode)
 
 class ConfigManager:
     """Manages the configuration for the desktop clock application."""
 
-    def __init__(self, config_file):
-        """Initialize the ConfigManager with a config file path."""
+    def __init__(self, config_file, write_delay=0.5):
+        """Initialize the ConfigManager with a config file path.
+
+        Changes are applied in memory immediately and written to disk by a
+        background thread once no further change arrived for write_delay
+        seconds. A write_delay of None writes synchronously on every change.
+        """
         self.config_file = config_file
+        self.snapshot_file = config_file + '.cache'
+        self.write_delay = write_delay
+        self.load_stats = {}
+        self.file_signature = None
         self.config = self.load_config()
+        self.model = ConfigModel(self.config)
+        self.lock = threading.RLock()
+        self.write_condition = threading.Condition(self.lock)
+        self.file_lock = threading.Lock()
+        self.pending_since = None
+        self.writer = None
+        self.subscribers = []
+        atexit.register(self.flush)
 
     def load_config(self):
-        """Load the configuration from the file, or use default if file not found."""
+        """Load the configuration, preferring a valid snapshot over parsing the YAML file."""
+        start = time.perf_counter()
+        try:
+            self.file_signature = self.get_file_signature()
+        except OSError:
+            self.file_signature = None
+        config = self.load_snapshot()
+        path = 'snapshot'
+        if config is None:
+            config, path = self.parse_config()
+        self.load_stats = {'path': path, 'seconds': time.perf_counter() - start}
+        return config
+
+    def parse_config(self):
+        """Parse the YAML file and merge in defaults, or use default if file not found."""
         try:
             with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YamlLoader)
             
             # Ensure all necessary keys exist with default values
             default_config = get_default_config()
@@ -29,28 +86,124 @@ class ConfigManager:
                 for key, value in default_config[section].items():
                     if key not in config[section]:
                         config[section][key] = value
-                        
-            # Convert tuples to lists
-            if 'clock' in config:
-                if 'color' in config['clock']:
-                    config['clock']['color'] = list(config['clock']['color'])
-                if 'background_color' in config['clock']:
-                    config['clock']['background_color'] = list(config['clock']['background_color'])
-            if 'main_window' in config:
-                if 'background_color' in config['main_window']:
-                    config['main_window']['background_color'] = list(config['main_window']['background_color'])                      
-
-            return config
+
+            self.normalize_config(config)
+            self.write_snapshot(config)
+            return config, 'yaml'
         except FileNotFoundError:
-            return get_default_config()
+            return get_default_config(), 'default'
+
+    def normalize_config(self, config):
+        """Convert tuples to lists."""
+        if 'clock' in config:
+            if 'color' in config['clock']:
+                config['clock']['color'] = list(config['clock']['color'])
+            if 'background_color' in config['clock']:
+                config['clock']['background_color'] = list(config['clock']['background_color'])
+        if 'main_window' in config:
+            if 'background_color' in config['main_window']:
+                config['main_window']['background_color'] = list(config['main_window']['background_color'])
+
+    def get_file_signature(self):
+        """Return the values that identify the current contents of the config file."""
+        stat = os.stat(self.config_file)
+        # Coarse mtimes can miss a same-size rewrite, so the contents are hashed as well
+        with open(self.config_file, 'rb') as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'content': content_hash, 'schema': get_schema_hash()}
+
+    def load_snapshot(self):
+        """Return the snapshotted config if it still matches the YAML file, otherwise None."""
+        try:
+            signature = self.get_file_signature()
+            with open(self.snapshot_file, 'rb') as f:
+                snapshot = marshal.load(f)
+            if snapshot.get('signature') != signature:
+                return None
+            return snapshot['config']
+        except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def write_snapshot(self, config):
+        """Store the merged, normalized config next to the YAML file."""
+        try:
+            snapshot = {'signature': self.get_file_signature(), 'config': config}
+            directory = os.path.dirname(os.path.abspath(self.snapshot_file))
+            fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(snapshot, f)
+            copy_file_mode(temp_path, self.snapshot_file)
+            os.replace(temp_path, self.snapshot_file)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not write config snapshot {self.snapshot_file}: {str(e)}")
 
     def save_config(self):
-        """Save the current configuration to the file."""
-        with open(self.config_file, 'w') as f:
-            yaml.dump(self.config, f)
+        """Save the current configuration to the file right away."""
+        with self.lock:
+            self.pending_since = time.monotonic()
+        self.flush()
+
+    def schedule_save(self):
+        """Mark the configuration dirty and let the writer thread save it after the debounce delay."""
+        if self.write_delay is None:
+            self.save_config()
+            return
+        with self.write_condition:
+            self.pending_since = time.monotonic()
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write_loop, name='config-writer', daemon=True)
+                self.writer.start()
+            self.write_condition.notify()
+
+    def write_loop(self):
+        """Coalesce bursts of changes into a single write once they settle."""
+        while True:
+            with self.write_condition:
+                while True:
+                    if self.pending_since is None:
+                        self.write_condition.wait()
+                        continue
+                    remaining = self.pending_since + self.write_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.write_condition.wait(remaining)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error saving config {self.config_file}: {str(e)}")
+
+    def flush(self):
+        """Write pending changes to disk, if any."""
+        with self.file_lock:
+            with self.lock:
+                if self.pending_since is None:
+                    return
+                self.pending_since = None
+                snapshot = copy.deepcopy(self.config)
+            self.write_file(snapshot)
+
+    def write_file(self, config):
+        """Atomically replace the config file with the given configuration."""
+        directory = os.path.dirname(os.path.abspath(self.config_file))
+        fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                yaml.dump(config, f)
+                f.flush()
+                os.fsync(f.fileno())
+            copy_file_mode(temp_path, self.config_file)
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        # Lets the file watcher recognize and skip our own write
+        self.file_signature = self.get_file_signature()
+        metrics.increment('config_writes')
+        self.normalize_config(config)
+        self.write_snapshot(config)
 
     def get_config(self):
-        """Get the entire configuration dictionary."""
+        """Get the entire configuration dictionary; hot paths should read self.model instead."""
         return self.config
 
     def get_setting(self, section, key):
@@ -58,7 +211,104 @@ class ConfigManager:
         return self.config[section][key]
 
     def set_setting(self, section, key, value):
-        """Set a specific setting value in the configuration and save it."""
-        self.config[section][key] = value
-        self.save_config()
+        """Set a specific setting value in the configuration and schedule a save."""
+        self.set_settings(section, {key: value})
+
+    def set_settings(self, section, values):
+        """Set several values of one section at once, schedule a single save and notify subscribers."""
+        with self.lock:
+            changes = self.update_values(section, values)
+        if changes:
+            self.schedule_save()
+            self.notify(changes)
+
+    def override_settings(self, section, values):
+        """Change values for the running clock and notify subscribers, without storing them in the file.
+
+        Used for values computed at runtime, such as scheduled colors.
+        """
+        changes = []
+        with self.lock:
+            for key, value in values.items():
+                old_value = getattr(getattr(self.model, section), key)
+                if old_value != value:
+                    value = self.model.set(section, key, value)
+                    changes.append(ConfigChange(section, key, old_value, value))
+        if changes:
+            self.notify(changes)
+
+    def update_values(self, section, values):
+        """Validate and store the values that differ from the current ones, returning the ConfigChanges."""
+        changes = []
+        for key, value in values.items():
+            old_value = self.config[section].get(key)
+            if old_value != value:
+                value = self.model.set(section, key, value)
+            if old_value != value:
+                self.config[section][key] = value
+                changes.append(ConfigChange(section, key, old_value, value))
+        return changes
+
+    def reload_config(self):
+        """Re-read the config file and apply the values that changed on disk, without saving them back."""
+        # Write our own pending changes first so they are not lost
+        self.flush()
+        result = self.read_changed_config()
+        if result is None:
+            return []
+        return self.apply_config(*result)
+
+    def read_changed_config(self):
+        """Parse and validate the config file if it changed since it was last loaded or written.
+
+        Returns (config, file signature), or None if the file is unchanged,
+        missing or unreadable. Does not touch the live configuration, so it may run on
+        any thread.
+        """
+        try:
+            signature = self.get_file_signature()
+            if signature == self.file_signature:
+                return None
+            config, _ = self.parse_config()
+            return validate_config(config), signature
+        except FileNotFoundError:
+            # No file yet, e.g. on the first run; the defaults stay in place
+            return None
+        except (OSError, yaml.YAMLError, TypeError, AttributeError) as e:
+            print(f"Warning: Could not reload config {self.config_file}: {str(e)}")
+            return None
+
+    def apply_config(self, config, signature):
+        """Apply the values of a reloaded config that differ from the live ones and notify subscribers."""
+        changes = []
+        with self.lock:
+            for section in self.config:
+                changes += self.update_values(section, config.get(section, {}))
+            self.file_signature = signature
+        if changes:
+            self.notify(changes)
+        return changes
+
+    def subscribe(self, callback, keys=None):
+        """Call callback with the list of ConfigChanges that touch the given keys.
+
+        keys is an iterable of (section, key) pairs; a key of None matches the
+        whole section and keys=None matches every change.
+        """
+        self.subscribers.append((callback, None if keys is None else frozenset(keys)))
+
+    def unsubscribe(self, callback):
+        """Stop notifying a callback registered with subscribe."""
+        self.subscribers = [(cb, keys) for cb, keys in self.subscribers if cb != callback]
+
+    def notify(self, changes):
+        """Deliver a change-set to every subscriber interested in part of it."""
+        for callback, keys in list(self.subscribers):
+            if keys is None:
+                relevant = changes
+            else:
+                relevant = [change for change in changes
+                            if (change.section, change.key) in keys or (change.section, None) in keys]
+            if relevant:
+                callback(relevant)
         
\ No newline at end of file
@@ -0,0 +1,134 @@
+from PyQt5.QtGui import QColor
+from .settings_definition import SETTINGS
+from .font_manager import font_manager
+
+# Spellings of booleans accepted from the config file, as YAML 1.1 reads them
+BOOL_STRINGS = {'true': True, 'yes': True, 'on': True, '1': True,
+                'false': False, 'no': False, 'off': False, '0': False}
+
+def parse_bool(value):
+    """Return value as a bool; accepts bools, 0 and 1, and the usual true/false spellings."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in BOOL_STRINGS:
+        return BOOL_STRINGS[value.strip().lower()]
+    raise ValueError("expected true or false")
+
+def validate_value(section, key, setting, value):
+    """Return value coerced to the setting's type and range, or the default if it is unusable."""
+    try:
+        setting_type = setting['type']
+        if setting_type == 'bool':
+            value = parse_bool(value)
+        elif setting_type == 'int':
+            value = int(value)
+            value = max(setting.get('min', value), min(value, setting.get('max', value)))
+        elif setting_type == 'color':
+            value = [max(0, min(int(channel), 255)) for channel in value]
+            if len(value) != 4:
+                raise ValueError("expected 4 channels")
+        elif setting_type == 'list':
+            value = list(value)
+        elif setting_type == 'str':
+            value = str(value)
+            if 'options' in setting and value not in setting['options']:
+                raise ValueError(f"expected one of {setting['options']}")
+        return value
+    except (TypeError, ValueError) as e:
+        print(f"Warning: Invalid value {value!r} for {section}.{key} ({str(e)}), using default")
+        return setting['default']
+
+def validate_config(config):
+    """Validate every known setting of a parsed config in place; uses no Qt objects, so any thread may call it."""
+    for section, settings in SETTINGS.items():
+        values = config.setdefault(section, {})
+        for key, setting in settings.items():
+            values[key] = validate_value(section, key, setting, values.get(key, setting['default']))
+    return config
+
+def make_font(font_name, font_size, use_custom_fonts):
+    """Create a font of the given family and point size."""
+    font = font_manager.get_font(font_name, use_custom_fonts)
+    font.setPointSize(font_size)
+    return font
+
+# Values derived from settings: name -> (keys it depends on, function of the section)
+DERIVED = {
+    'clock': {
+        'main_font': (('font', 'font_size', 'use_custom_fonts'),
+                      lambda clock: make_font(clock.font, clock.font_size, clock.use_custom_fonts)),
+        'seconds_font': (('font', 'seconds_font_size', 'use_custom_fonts'),
+                         lambda clock: make_font(clock.font, clock.seconds_font_size, clock.use_custom_fonts)),
+        'lcd_font': (('font',), lambda clock: font_manager.is_lcd_font(clock.font)),
+    },
+}
+
+class ConfigSection:
+    """Base class for the typed, slotted section objects compiled from SETTINGS."""
+
+    __slots__ = ('derived_values',)
+    SECTION = None
+    SETTINGS = {}
+    DERIVED = {}
+
+    def __init__(self, values):
+        """Initialize the section from a dictionary, validating every value once."""
+        self.derived_values = {}
+        for key, setting in self.SETTINGS.items():
+            value = validate_value(self.SECTION, key, setting, values.get(key, setting['default']))
+            setattr(self, key, value)
+            values[key] = value
+
+    def set(self, key, value):
+        """Validate and store a value, dropping the derived values that depend on it."""
+        setting = self.SETTINGS.get(key)
+        if setting is None:
+            return value
+        value = validate_value(self.SECTION, key, setting, value)
+        setattr(self, key, value)
+        self.derived_values.pop(key, None)
+        for name, (dependencies, _) in self.DERIVED.items():
+            if key in dependencies:
+                self.derived_values.pop(name, None)
+        return value
+
+    def qcolor(self, key):
+        """Return the cached QColor of a color setting."""
+        color = self.derived_values.get(key)
+        if color is None:
+            color = self.derived_values[key] = QColor(*getattr(self, key))
+        return color
+
+    def derived(self, name):
+        """Return a cached derived value, computing it on first use."""
+        if name not in self.derived_values:
+            self.derived_values[name] = self.DERIVED[name][1](self)
+        return self.derived_values[name]
+
+def compile_section(section, settings):
+    """Build a slotted ConfigSection subclass for one SETTINGS section."""
+    class_name = ''.join(part.capitalize() for part in section.split('_')) + 'Config'
+    return type(class_name, (ConfigSection,), {
+        '__slots__': tuple(settings),
+        'SECTION': section,
+        'SETTINGS': settings,
+        'DERIVED': DERIVED.get(section, {}),
+    })
+
+SECTION_CLASSES = {section: compile_section(section, settings) for section, settings in SETTINGS.items()}
+
+class ConfigModel:
+    """Typed attribute access to the configuration, e.g. model.clock.font_size."""
+
+    __slots__ = tuple(SECTION_CLASSES)
+
+    def __init__(self, config):
+        """Build the section objects, writing validated values back into the config dictionary."""
+        for section, section_class in SECTION_CLASSES.items():
+            setattr(self, section, section_class(config.setdefault(section, {})))
+
+    def set(self, section, key, value):
+        """Validate and store a value, returning the value that was stored."""
+        return getattr(self, section).set(key, value)
@@ -0,0 +1,67 @@
+import os
+import threading
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+class ConfigWatcher(QObject):
+    """Reloads the configuration when the config file is changed by someone else."""
+
+    config_read = pyqtSignal(object)
+
+    # Editors often save in several steps; wait for the burst to settle
+    DEBOUNCE_MS = 300
+
+    def __init__(self, config_manager, parent=None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.path = os.path.abspath(config_manager.config_file)
+        self.reading = False
+        self.read_again = False
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self.start_read)
+        self.config_read.connect(self.apply)
+
+        # The directory is watched too, because atomic saves replace the file and drop its watch
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.addPath(os.path.dirname(self.path))
+        self.watch_file()
+        self.watcher.fileChanged.connect(self.schedule_read)
+        self.watcher.directoryChanged.connect(self.schedule_read)
+
+    def watch_file(self):
+        """Watch the config file itself, if it exists and is not watched yet."""
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)
+
+    def schedule_read(self, path):
+        """Restart the debounce delay after every change notification."""
+        self.debounce_timer.start()
+
+    def start_read(self):
+        """Parse and validate the file on a worker thread."""
+        self.watch_file()
+        if self.reading:
+            self.read_again = True
+            return
+        self.reading = True
+        threading.Thread(target=self.read, name='config-reader', daemon=True).start()
+
+    def read(self):
+        """Read the file on the worker thread; the result is delivered to the GUI thread."""
+        # Write our own pending changes first so they are not lost, like reload_config does
+        try:
+            self.config_manager.flush()
+        except Exception as e:
+            print(f"Error saving config {self.config_manager.config_file}: {str(e)}")
+        self.config_read.emit(self.config_manager.read_changed_config())
+
+    def apply(self, result):
+        """Apply the changed values on the GUI thread."""
+        self.reading = False
+        if result is not None:
+            self.config_manager.apply_config(*result)
+        if self.read_again:
+            self.read_again = False
+            self.start_read()
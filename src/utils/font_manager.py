@@ -1,29 +1,159 @@
+import hashlib
+import json
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtGui import QFontDatabase, QFont
 from PyQt5.QtCore import QFileInfo
+from .memory_report import memory_report
+
+NAME_ID_FAMILY = 1
+NAME_ID_STYLE = 2
+
+def read_font_names(font_path):
+    """Read the family and style names from the name table of a TrueType/OpenType file."""
+    with open(font_path, 'rb') as f:
+        data = f.read()
+    num_tables = struct.unpack_from('>H', data, 4)[0]
+    for i in range(num_tables):
+        tag, _, offset, _ = struct.unpack_from('>4sIII', data, 12 + i * 16)
+        if tag == b'name':
+            break
+    else:
+        raise ValueError("no name table")
+
+    _, count, string_offset = struct.unpack_from('>HHH', data, offset)
+    names = {}
+    for i in range(count):
+        platform_id, _, language_id, name_id, length, name_offset = struct.unpack_from('>HHHHHH', data, offset + 6 + i * 12)
+        if name_id not in (NAME_ID_FAMILY, NAME_ID_STYLE):
+            continue
+        start = offset + string_offset + name_offset
+        raw = data[start:start + length]
+        # Prefer Windows English names, fall back to Macintosh Roman
+        if platform_id == 3:
+            priority = 0 if language_id == 0x409 else 1
+            text = raw.decode('utf-16-be', errors='replace')
+        elif platform_id == 1:
+            priority = 2
+            text = raw.decode('latin-1')
+        else:
+            continue
+        if name_id not in names or priority < names[name_id][0]:
+            names[name_id] = (priority, text)
+
+    if NAME_ID_FAMILY not in names:
+        raise ValueError("no family name")
+    return names[NAME_ID_FAMILY][1], names.get(NAME_ID_STYLE, (0, 'Regular'))[1]
+
+def index_font_file(font_path, is_lcd_font, mtime_ns, size):
+    """Build the index entry for a single font file."""
+    family, style = read_font_names(font_path)
+    with open(font_path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    return {'family': family, 'style': style, 'lcd': is_lcd_font,
+            'mtime_ns': mtime_ns, 'size': size, 'hash': digest}
 
 class FontManager:
-    def __init__(self):
+    def __init__(self, fonts_dir='fonts', index_file='font_index.json'):
+        self.fonts_dir = fonts_dir
+        self.index_file = index_file
+        self.font_index = {}
         self.custom_fonts = {}
-        self.font_ids = []
+        self.font_ids = {}
         self.lcd_fonts = set()
 
-    def load_custom_fonts(self):
-        fonts_dir = 'fonts'
-        if not os.path.exists(fonts_dir):
-            print(f"Warning: {fonts_dir} directory not found.")
+    def load_custom_fonts(self, rescan=True):
+        """Refresh the font index; fonts are registered with Qt only when first used.
+
+        With rescan=False a previously saved index is trusted as is, so startup
+        does not touch the font files; a full rescan can follow later.
+        """
+        if not os.path.exists(self.fonts_dir):
+            print(f"Warning: {self.fonts_dir} directory not found.")
             return
 
-        for family_dir in os.listdir(fonts_dir):
-            family_path = os.path.join(fonts_dir, family_dir)
+        index = self.load_index()
+        self.font_index = self.scan_fonts(index) if rescan or not index else index
+        if self.font_index is not index:
+            self.save_index()
+
+        self.custom_fonts = {}
+        self.lcd_fonts = set()
+        for font_path, entry in self.font_index.items():
+            self.custom_fonts.setdefault(entry['family'], []).append(font_path)
+            if entry['lcd']:
+                self.lcd_fonts.add(entry['family'])
+
+    def load_index(self):
+        """Load the persistent font index, or return an empty one."""
+        try:
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_index(self):
+        """Write the font index next to the configuration."""
+        try:
+            temp_path = self.index_file + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(self.font_index, f, indent=1)
+            os.replace(temp_path, self.index_file)
+        except OSError as e:
+            print(f"Warning: Could not write font index {self.index_file}: {str(e)}")
+
+    def scan_fonts(self, old_index):
+        """Return an up-to-date index, re-reading only new or modified files in a worker pool."""
+        index = {}
+        changed = []
+        for family_dir in os.listdir(self.fonts_dir):
+            family_path = os.path.join(self.fonts_dir, family_dir)
             if os.path.isdir(family_path):
                 is_lcd_font = 'lcd' in family_dir.lower()
                 for font_file in os.listdir(family_path):
                     if font_file.lower().endswith(('.ttf', '.otf')):
                         font_path = os.path.join(family_path, font_file)
-                        self.load_single_font(font_path, is_lcd_font)
+                        stat = os.stat(font_path)
+                        entry = old_index.get(font_path)
+                        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                            index[font_path] = entry
+                        else:
+                            changed.append((font_path, is_lcd_font, stat.st_mtime_ns, stat.st_size))
+
+        if changed:
+            with ThreadPoolExecutor() as pool:
+                futures = {font_path: pool.submit(index_font_file, font_path, *args)
+                           for font_path, *args in changed}
+                for font_path, future in futures.items():
+                    try:
+                        index[font_path] = future.result()
+                    except Exception as e:
+                        print(f"Error indexing font {font_path}: {str(e)}")
+        return index
 
-    def load_single_font(self, font_path, is_lcd_font=False):
+    def register_font(self, font_name):
+        """Register every file of a custom font family with Qt, if not done yet."""
+        for font_path in list(self.custom_fonts.get(font_name, [])):
+            if font_path not in self.font_ids:
+                self.load_single_font(font_path)
+
+    def register_all_fonts(self):
+        """Register all indexed custom fonts, e.g. for previewing them in a font list."""
+        for font_name in list(self.custom_fonts):
+            self.register_font(font_name)
+
+    def release_unused_fonts(self, keep_families):
+        """Unregister the custom fonts of all families not in keep_families; they are registered again when next used."""
+        released = 0
+        for font_path, font_id in list(self.font_ids.items()):
+            if self.font_index.get(font_path, {}).get('family') not in keep_families:
+                QFontDatabase.removeApplicationFont(font_id)
+                del self.font_ids[font_path]
+                released += 1
+        return released
+
+    def load_single_font(self, font_path):
         try:
             if not QFileInfo(font_path).isReadable():
                 print(f"Warning: Font file is not readable: {font_path}")
@@ -31,13 +161,10 @@ class FontManager:
 
             font_id = QFontDatabase.addApplicationFont(font_path)
             if font_id != -1:
-                self.font_ids.append(font_id)
+                self.font_ids[font_path] = font_id
                 font_families = QFontDatabase.applicationFontFamilies(font_id)
                 if font_families:
-                    font_family = font_families[0]
-                    self.custom_fonts[font_family] = font_path
-                    if is_lcd_font:
-                        self.lcd_fonts.add(font_family)
+                    self.sync_family_name(font_path, font_families[0])
                 else:
                     print(f"Warning: Could not load font families for {font_path}")
             else:
@@ -45,6 +172,22 @@ class FontManager:
         except Exception as e:
             print(f"Error loading font {font_path}: {str(e)}")
 
+    def sync_family_name(self, font_path, font_family):
+        """Adopt Qt's family name for a font if it differs from the indexed one."""
+        entry = self.font_index[font_path]
+        if entry['family'] == font_family:
+            return
+        old_family = entry['family']
+        self.custom_fonts[old_family].remove(font_path)
+        if not self.custom_fonts[old_family]:
+            del self.custom_fonts[old_family]
+            self.lcd_fonts.discard(old_family)
+        entry['family'] = font_family
+        self.custom_fonts.setdefault(font_family, []).append(font_path)
+        if entry['lcd']:
+            self.lcd_fonts.add(font_family)
+        self.save_index()
+
     def get_custom_fonts(self):
         return list(self.custom_fonts.keys())
 
@@ -52,11 +195,12 @@ class FontManager:
         return QFontDatabase().families()
 
     def get_font(self, font_name, use_custom_fonts):
-        if use_custom_fonts and font_name in self.custom_fonts:
-            return QFont(font_name)
+        if font_name in self.custom_fonts:
+            self.register_font(font_name)
         return QFont(font_name)
 
     def is_lcd_font(self, font_name):
         return font_name in self.lcd_fonts
 
 font_manager = FontManager()
+memory_report.add_probe('registered_fonts', lambda: len(font_manager.font_ids))
@@ -0,0 +1,87 @@
+import time
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+from .metrics import metrics
+
+class FrameLoop(QObject):
+    """Emits a frame signal at the display refresh rate, dropping frames that do not fit the budget."""
+
+    frame = pyqtSignal()
+
+    # Share of each frame interval the frame handler may use before the next frame is dropped
+    BUDGET_SHARE = 0.5
+
+    def __init__(self, parent=None, refresh_rate=60.0):
+        """Initialize the loop for a refresh rate in Hz."""
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_timeout)
+        self.set_refresh_rate(refresh_rate)
+        self.running = False
+        self.next_frame = 0.0
+        self.frame_count = 0
+        self.dropped_frames = 0
+        self.fps = 0.0
+        self.fps_window_start = 0.0
+        self.fps_window_frames = 0
+
+    def set_refresh_rate(self, refresh_rate):
+        """Pace frames to the given refresh rate."""
+        self.frame_interval = 1.0 / max(1.0, refresh_rate)
+        self.budget = self.frame_interval * self.BUDGET_SHARE
+
+    def start(self):
+        """Start emitting frames, beginning right away."""
+        now = time.monotonic()
+        self.next_frame = now
+        self.fps_window_start = now
+        self.fps_window_frames = 0
+        self.running = True
+        self.timer.start(0)
+
+    def stop(self):
+        """Stop emitting frames."""
+        self.running = False
+        self.timer.stop()
+        self.fps = 0.0
+
+    def is_active(self):
+        """Return True if the loop is running."""
+        return self.running
+
+    def on_timeout(self):
+        """Emit one frame and schedule the next frame boundary."""
+        now = time.monotonic()
+        late = now - self.next_frame
+        if late >= self.frame_interval:
+            # Frames whose slot has already passed are dropped, not drawn late
+            skipped = int(late / self.frame_interval)
+            self.dropped_frames += skipped
+            self.next_frame += skipped * self.frame_interval
+
+        start = time.perf_counter()
+        self.frame.emit()
+        cost = time.perf_counter() - start
+        metrics.observe('frame_ms', cost * 1000)
+        self.frame_count += 1
+        self.fps_window_frames += 1
+
+        self.next_frame += self.frame_interval
+        if cost > self.budget:
+            # Give the event loop room to paint by skipping the next frame
+            self.next_frame += self.frame_interval
+            self.dropped_frames += 1
+
+        now = time.monotonic()
+        if now - self.fps_window_start >= 1.0:
+            self.fps = self.fps_window_frames / (now - self.fps_window_start)
+            self.fps_window_start = now
+            self.fps_window_frames = 0
+        if self.running:
+            # The frame handler may have stopped the loop
+            self.timer.start(max(0, int((self.next_frame - now) * 1000)))
+
+    def get_stats(self):
+        """Return the achieved frame rate and frame counters."""
+        return {'fps': self.fps, 'frames': self.frame_count, 'dropped': self.dropped_frames}
@@ -0,0 +1,106 @@
+import ctypes
+import mmap
+import os
+import struct
+import tempfile
+import time
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer, Qt
+from PyQt5.QtGui import QImage, QPainter
+
+# Header: magic, version, width, height, stride, QImage format, sequence, timestamp
+HEADER_FORMAT = '<4sIIIIIQd'
+HEADER_SIZE = 64
+SEQUENCE_OFFSET = struct.calcsize('<4sIIIII')
+MAGIC = b'CLKF'
+VERSION = 1
+IMAGE_FORMAT = QImage.Format_ARGB32_Premultiplied
+
+def get_default_path():
+    """Return the default framebuffer path, in POSIX shared memory where available."""
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(directory, 'clock-framebuffer')
+
+class FramebufferPublisher(QObject):
+    """Renders a widget offscreen into a QImage that lives in a memory-mapped file.
+
+    The file starts with a HEADER_SIZE byte header followed by the pixels.
+    The sequence number is odd while a frame is being written and even once
+    it is complete, so readers retry when it is odd or changed during a read.
+    """
+
+    def __init__(self, widget, path, width, height):
+        """Map the framebuffer file and render the first frame."""
+        super().__init__(widget)
+        self.widget = widget
+        self.path = path
+        self.width = width
+        self.height = height
+        self.stride = width * 4
+        self.sequence = 0
+
+        size = HEADER_SIZE + self.stride * height
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            self.buffer = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        # The image paints straight into the mapping, there is no copy per frame
+        self.pixels = ctypes.c_char.from_buffer(self.buffer, HEADER_SIZE)
+        self.image = QImage(sip.voidptr(ctypes.addressof(self.pixels)), width, height, self.stride, IMAGE_FORMAT)
+        self.write_header(time.time())
+
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.timeout.connect(self.publish)
+        widget.resize(width, height)
+        widget.display_changed.connect(self.schedule_publish)
+        self.publish()
+
+    def write_header(self, timestamp):
+        """Write the complete header with the current sequence number."""
+        struct.pack_into(HEADER_FORMAT, self.buffer, 0, MAGIC, VERSION, self.width, self.height,
+                         self.stride, int(IMAGE_FORMAT), self.sequence, timestamp)
+
+    def schedule_publish(self):
+        """Publish once the current burst of changes has been processed."""
+        if not self.render_timer.isActive():
+            self.render_timer.start(0)
+
+    def publish(self):
+        """Render the widget into the shared image and bump the sequence number."""
+        self.sequence += 1
+        struct.pack_into('<Q', self.buffer, SEQUENCE_OFFSET, self.sequence)
+        self.image.fill(Qt.transparent)
+        painter = QPainter(self.image)
+        self.widget.render(painter)
+        painter.end()
+        self.sequence += 1
+        self.write_header(time.time())
+
+    def close(self):
+        """Unmap the framebuffer; the file stays for readers to see the last frame."""
+        self.widget.display_changed.disconnect(self.schedule_publish)
+        self.image = None
+        self.pixels = None
+        self.buffer.close()
+
+def read_framebuffer(path, retries=100):
+    """Return (sequence, timestamp, width, height, pixels) of the last complete frame, or None."""
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        for _ in range(retries):
+            magic, version, width, height, stride, _, sequence, timestamp = struct.unpack_from(HEADER_FORMAT, buffer, 0)
+            if magic != MAGIC or version != VERSION:
+                return None
+            if sequence % 2:
+                time.sleep(0.001)
+                continue
+            pixels = buffer[HEADER_SIZE:HEADER_SIZE + stride * height]
+            if struct.unpack_from('<Q', buffer, SEQUENCE_OFFSET)[0] == sequence:
+                return sequence, timestamp, width, height, pixels
+        return None
+    finally:
+        buffer.close()
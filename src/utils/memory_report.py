@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tracemalloc
+
+# Subsystems and the module name fragments whose allocations count towards them
+SUBSYSTEMS = (
+    ('fonts', ('font_manager', 'font_model', 'font_fit', 'glyph_atlas')),
+    ('config', ('config_', 'settings_definition', 'yaml')),
+    ('settings_ui', ('settings_window', 'color_button')),
+    ('rendering', ('clock_widget', 'main_window', 'world_clock', 'style_cache', 'stats_overlay', 'framebuffer')),
+    ('scheduling', ('tick_scheduler', 'frame_loop', 'stopwatch', 'color_schedule', 'zone_offsets')),
+    ('diagnostics', ('metrics', 'memory_report', 'startup_timer')),
+    ('qt_bindings', ('PyQt5', 'sip')),
+)
+
+def memory_report_requested():
+    """Return True if memory should be traced and reported."""
+    return '--memory-report' in sys.argv or bool(os.environ.get('CLOCK_MEMORY_REPORT'))
+
+def get_subsystem(filename):
+    """Return the subsystem an allocation in the given source file belongs to."""
+    for subsystem, fragments in SUBSYSTEMS:
+        if any(fragment in filename for fragment in fragments):
+            return subsystem
+    return 'other'
+
+def get_rss_bytes():
+    """Return the resident set size of the process, or None if it cannot be read."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Only the peak is available here; Linux reports it in KiB, macOS in bytes
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+class MemoryReport:
+    """Process memory broken down by subsystem: Python allocations plus Qt-side usage reported by probes."""
+
+    def __init__(self):
+        self.probes = {}
+
+    def add_probe(self, name, callback):
+        """Register a callback returning a number (bytes or a count) to include in reports."""
+        self.probes[name] = callback
+
+    def get_python_allocations(self):
+        """Return the bytes currently allocated from Python per subsystem, if tracing is on."""
+        if not tracemalloc.is_tracing():
+            return None
+        allocations = {}
+        for stat in tracemalloc.take_snapshot().statistics('filename'):
+            subsystem = get_subsystem(stat.traceback[0].filename)
+            allocations[subsystem] = allocations.get(subsystem, 0) + stat.size
+        return dict(sorted(allocations.items(), key=lambda item: -item[1]))
+
+    def collect(self):
+        """Return the RSS, the Python allocations per subsystem and every probe's value."""
+        report = {'rss_bytes': get_rss_bytes()}
+        allocations = self.get_python_allocations()
+        if allocations is not None:
+            report['python_bytes'] = allocations
+            report['python_peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        probes = {}
+        for name, callback in self.probes.items():
+            try:
+                probes[name] = callback()
+            except Exception as e:
+                print(f"Warning: Memory probe {name} failed: {str(e)}")
+        report['probes'] = probes
+        return report
+
+    def summary_lines(self):
+        """Return short text lines for the stats overlay; cheap enough to call every second."""
+        rss = get_rss_bytes()
+        lines = [f"rss: {rss / 1048576:.1f} MiB" if rss is not None else "rss: n/a"]
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"python heap: {current / 1048576:.1f} MiB, peak {peak / 1048576:.1f} MiB")
+        return lines
+
+    def dump(self, label):
+        """Print a labelled report as JSON."""
+        print(json.dumps({'memory_report': label, **self.collect()}))
+
+memory_report = MemoryReport()
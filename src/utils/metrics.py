@@ -0,0 +1,164 @@
+import bisect
+import json
+import os
+import threading
+import time
+from PyQt5.QtCore import QObject, QTimer
+
+class Histogram:
+    """A fixed-bucket histogram that keeps count, sum and max of its observations."""
+
+    def __init__(self, bounds):
+        """Initialize the histogram with ascending upper bucket bounds."""
+        self.bounds = list(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """Add one observation."""
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction):
+        """Return the upper bound of the bucket holding the given fraction of observations."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.buckets):
+            seen += bucket
+            if seen >= threshold:
+                return bound
+        return self.max
+
+    def snapshot(self):
+        """Return the histogram as a JSON-serializable dictionary."""
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'max': self.max,
+            'buckets': dict(zip([str(bound) for bound in self.bounds] + ['inf'], self.buckets)),
+        }
+
+DURATION_BOUNDS_MS = [0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 16, 33, 50, 100]
+AREA_BOUNDS_PX = [100, 1000, 5000, 10000, 50000, 100000, 500000, 1000000]
+
+class Metrics:
+    """Process-wide performance counters and histograms, safe to update from any thread."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.histograms = {
+            'tick_ms': Histogram(DURATION_BOUNDS_MS),
+            'paint_ms': Histogram(DURATION_BOUNDS_MS),
+            'paint_area_px': Histogram(AREA_BOUNDS_PX),
+            'timer_lateness_ms': Histogram(DURATION_BOUNDS_MS),
+            'frame_ms': Histogram(DURATION_BOUNDS_MS),
+        }
+        self.counters = {
+            'stylesheet_applies': 0,
+            'palette_applies': 0,
+            'config_writes': 0,
+        }
+
+    def observe(self, name, value):
+        """Add an observation to a histogram, creating it on first use."""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(DURATION_BOUNDS_MS)
+            histogram.observe(value)
+
+    def increment(self, name, amount=1):
+        """Increase a counter."""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Return all metrics as a JSON-serializable dictionary."""
+        with self.lock:
+            return {
+                'timestamp': time.time(),
+                'uptime_s': time.time() - self.started,
+                'counters': dict(self.counters),
+                'histograms': {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+            }
+
+    def summary_lines(self):
+        """Return a short human-readable summary for the on-screen overlay."""
+        lines = []
+        with self.lock:
+            for name, histogram in self.histograms.items():
+                if histogram.count:
+                    lines.append(f"{name}: p50 {histogram.percentile(0.5):g} p95 {histogram.percentile(0.95):g} "
+                                 f"max {histogram.max:.2f} n={histogram.count}")
+            lines.extend(f"{name}: {value}" for name, value in self.counters.items())
+        return lines
+
+metrics = Metrics()
+
+class MetricsExporter(QObject):
+    """Periodically writes a JSON metrics snapshot to a file and/or a local socket."""
+
+    def __init__(self, file_path=None, socket_name=None, interval=10.0, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.socket_name = socket_name
+        self.socket = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.export)
+        self.timer.start(int(interval * 1000))
+
+    @classmethod
+    def from_environment(cls, parent=None):
+        """Create an exporter from CLOCK_METRICS_FILE/SOCKET/INTERVAL, or return None if unset."""
+        file_path = os.environ.get('CLOCK_METRICS_FILE')
+        socket_name = os.environ.get('CLOCK_METRICS_SOCKET')
+        if not file_path and not socket_name:
+            return None
+        interval = float(os.environ.get('CLOCK_METRICS_INTERVAL', '10'))
+        return cls(file_path, socket_name, interval, parent)
+
+    def export(self):
+        """Write the current snapshot to the configured outputs."""
+        payload = json.dumps(metrics.snapshot())
+        if self.file_path:
+            try:
+                temp_path = self.file_path + '.tmp'
+                with open(temp_path, 'w') as f:
+                    f.write(payload)
+                os.replace(temp_path, self.file_path)
+            except OSError as e:
+                print(f"Warning: Could not write metrics to {self.file_path}: {str(e)}")
+        if self.socket_name:
+            self.send(payload)
+
+    def send(self, payload):
+        """Send one JSON line to the local socket; without a connection the sample is dropped.
+
+        Connecting never blocks the GUI thread: it starts in the background and
+        a fresh snapshot is sent as soon as it succeeds.
+        """
+        from PyQt5.QtNetwork import QLocalSocket
+        if self.socket is None:
+            self.socket = QLocalSocket(self)
+            self.socket.connected.connect(lambda: self.write_line(json.dumps(metrics.snapshot())))
+            self.socket.errorOccurred.connect(lambda error: self.socket.abort())
+        state = self.socket.state()
+        if state == QLocalSocket.ConnectedState:
+            self.write_line(payload)
+        elif state == QLocalSocket.UnconnectedState:
+            self.socket.connectToServer(self.socket_name)
+
+    def write_line(self, payload):
+        """Queue one JSON line on the connected socket."""
+        self.socket.write((payload + '\n').encode())
+        self.socket.flush()
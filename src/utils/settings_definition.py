@@ -1,3 +1,4 @@
+import hashlib
 from PyQt5.QtWidgets import QSpinBox, QFontComboBox, QColorDialog, QCheckBox, QSlider, QComboBox
 from PyQt5.QtCore import Qt
 
@@ -37,6 +38,12 @@ SETTINGS = {
             'min': 0,
             'max': 50
         },        
+        'low_memory': {
+            'type': 'bool',
+            'default': False,
+            'widget': QCheckBox,
+            'label': 'Low Memory Mode'  # Frees the settings window and unused fonts after use
+        },
     },
     'clock': {
         'use_custom_fonts': {
@@ -59,6 +66,12 @@ SETTINGS = {
             'min': 1,
             'max': 200
         },
+        'auto_fit': {
+            'type': 'bool',
+            'default': False,  # Font sizes then only set the seconds to main size ratio
+            'widget': QCheckBox,
+            'label': 'Fit Font Size to Window'
+        },
         'seconds_font_size': {
             'type': 'int',
             'default': 81,  # Alapértelmezetten ugyanaz, mint a fő betűméret
@@ -115,7 +128,67 @@ SETTINGS = {
             'min': 0,
             'max': 255,
             'orientation': Qt.Horizontal
-        },             
+        },
+        'render_mode': {
+            'type': 'str',
+            'default': 'labels',
+            'widget': QComboBox,
+            'label': 'Render Mode',
+            'options': ['labels', 'atlas']  # 'atlas' blits cached glyphs, for low-power panels
+        },
+        'display_mode': {
+            'type': 'str',
+            'default': 'clock',
+            'widget': QComboBox,
+            'label': 'Display Mode',
+            'options': ['clock', 'stopwatch']
+        },
+        'subsecond_digits': {
+            'type': 'int',
+            'default': 0,  # 1 shows tenths, 3 milliseconds; redrawn every display frame
+            'widget': QSpinBox,
+            'label': 'Sub-second Digits',
+            'min': 0,
+            'max': 3
+        },
+    },
+    'world_clock': {
+        'time_zones': {
+            'type': 'list',
+            'default': ['UTC', 'America/New_York', 'Europe/London', 'Asia/Tokyo'],
+            'widget': None  # Edited in config.yaml, used by --world-clock
+        },
+        'columns': {
+            'type': 'int',
+            'default': 0,  # 0 arranges the clocks in a square grid
+            'widget': None,
+            'min': 0,
+            'max': 100
+        },
+    },
+    # Keyframes such as [['07:00', [209, 209, 209, 255]], ['22:00', [120, 0, 0, 255]]];
+    # colors blend between keyframes and an empty list keeps the color setting as is
+    'color_schedules': {
+        'clock_color': {
+            'type': 'list',
+            'default': [],
+            'widget': None
+        },
+        'clock_seconds_color': {
+            'type': 'list',
+            'default': [],
+            'widget': None
+        },
+        'clock_background_color': {
+            'type': 'list',
+            'default': [],
+            'widget': None
+        },
+        'main_window_background_color': {
+            'type': 'list',
+            'default': [],
+            'widget': None
+        },
     }
 }
 
@@ -123,3 +196,9 @@ def get_default_config():
     """Generate a default configuration based on the SETTINGS structure."""
     return {section: {key: setting['default'] for key, setting in items.items()}
             for section, items in SETTINGS.items()}
+
+def get_schema_hash():
+    """Return a hash of the setting keys, types and defaults, used to validate cached configs."""
+    schema = [(section, key, setting['type'], repr(setting['default']))
+              for section, items in SETTINGS.items() for key, setting in items.items()]
+    return hashlib.sha1(repr(schema).encode()).hexdigest()
@@ -0,0 +1,90 @@
+import getpass
+import hashlib
+import json
+import os
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+# Command line flags forwarded to the running instance, and the command each one stands for
+COMMAND_ARGUMENTS = {
+    '--show': 'show',
+    '--settings': 'settings',
+    '--reload-config': 'reload-config',
+    '--new-window': 'new-window',
+    '--world-clock': 'world-clock',
+}
+CONNECT_TIMEOUT_MS = 200
+
+def get_server_name(config_file):
+    """Return the local server name for instances sharing one user and config file."""
+    config_path = os.path.abspath(config_file)
+    return f"desktop-clock-{getpass.getuser()}-{hashlib.sha1(config_path.encode()).hexdigest()[:12]}"
+
+def get_commands(arguments):
+    """Return the commands requested by the command line, showing the clock by default."""
+    return [COMMAND_ARGUMENTS[argument] for argument in arguments if argument in COMMAND_ARGUMENTS] or ['show']
+
+def is_server_running(server_name):
+    """Return True if an instance answers on the server name."""
+    socket = QLocalSocket()
+    socket.connectToServer(server_name)
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return False
+    socket.disconnectFromServer()
+    return True
+
+def forward_to_running_instance(server_name, commands):
+    """Send commands to a running instance. Returns False if there is none."""
+    socket = QLocalSocket()
+    socket.connectToServer(server_name)
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return False
+    socket.write((json.dumps({'commands': commands}) + '\n').encode())
+    socket.waitForBytesWritten(CONNECT_TIMEOUT_MS)
+    socket.disconnectFromServer()
+    return True
+
+class InstanceServer(QObject):
+    """Listens for commands forwarded by later launches of the application."""
+
+    command_received = pyqtSignal(str)
+
+    def __init__(self, server_name, parent=None):
+        """Start listening; is_listening() is False if another instance got the name first."""
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.accept_connections)
+        if self.server.listen(server_name):
+            return
+        if is_server_running(server_name):
+            # Another instance started listening since our forward attempt
+            return
+        # Nobody answers on the name, so the socket was left behind by a crashed instance
+        QLocalServer.removeServer(server_name)
+        if not self.server.listen(server_name):
+            print(f"Warning: Could not listen for other instances: {self.server.errorString()}")
+
+    def is_listening(self):
+        """Return True if this instance receives the commands of later launches."""
+        return self.server.isListening()
+
+    def accept_connections(self):
+        """Read the request of every waiting connection."""
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_commands(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            # The request may already have arrived with the connection
+            self.read_commands(socket)
+
+    def read_commands(self, socket):
+        """Emit the commands of every complete request line received on a socket."""
+        while socket.canReadLine():
+            line = bytes(socket.readLine()).decode(errors='replace')
+            try:
+                commands = json.loads(line)['commands']
+            except (ValueError, KeyError, TypeError):
+                print(f"Warning: Ignoring malformed instance request {line!r}")
+                continue
+            for command in commands:
+                self.command_received.emit(str(command))
@@ -0,0 +1,47 @@
+import json
+import time
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+class StartupTimer(QObject):
+    """Records how long each startup phase takes, up to the first paint of a widget."""
+
+    def __init__(self, start):
+        """Initialize the timer with the perf_counter value taken when the process started."""
+        super().__init__()
+        self.start = start
+        self.last = start
+        self.phases = []
+        self.widget = None
+        self.first_paint_callback = None
+
+    def mark(self, phase):
+        """Record the time spent since the previous mark under the given phase name."""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def watch_first_paint(self, widget, callback):
+        """Call callback once the widget has finished its first paint."""
+        self.widget = widget
+        self.first_paint_callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.widget and event.type() == QEvent.Paint:
+            self.widget.removeEventFilter(self)
+            self.widget = None
+            # Run after the paint event has been handled
+            QTimer.singleShot(0, self.first_paint_callback)
+        return False
+
+    def report(self):
+        """Return the phase timings in milliseconds."""
+        phases = {phase: round(seconds * 1000, 2) for phase, seconds in self.phases}
+        return {'phases_ms': phases, 'total_ms': round((self.last - self.start) * 1000, 2)}
+
+    def dump(self, extra=None):
+        """Print the phase timings as JSON."""
+        report = self.report()
+        if extra:
+            report.update(extra)
+        print(json.dumps(report))
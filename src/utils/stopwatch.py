@@ -0,0 +1,39 @@
+import datetime
+import time
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+class Stopwatch:
+    """Measures elapsed time across start/stop cycles using the monotonic clock."""
+
+    def __init__(self):
+        self.running = False
+        self.started_at = 0.0
+        self.accumulated = 0.0
+
+    def start(self):
+        """Start or continue measuring."""
+        if not self.running:
+            self.running = True
+            self.started_at = time.monotonic()
+
+    def stop(self):
+        """Pause measuring, keeping the elapsed time."""
+        if self.running:
+            self.accumulated += time.monotonic() - self.started_at
+            self.running = False
+
+    def reset(self):
+        """Set the elapsed time back to zero, keeping the running state."""
+        self.accumulated = 0.0
+        self.started_at = time.monotonic()
+
+    def elapsed(self):
+        """Return the elapsed time in seconds."""
+        if self.running:
+            return self.accumulated + time.monotonic() - self.started_at
+        return self.accumulated
+
+    def as_datetime(self):
+        """Return the elapsed time as a datetime, so it can be formatted like a clock."""
+        return EPOCH + datetime.timedelta(seconds=self.elapsed())
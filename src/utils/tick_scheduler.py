@@ -0,0 +1,133 @@
+import datetime
+import math
+import time
+from PyQt5.QtCore import QObject, QTimer, QEvent, Qt, pyqtSignal
+from .metrics import metrics
+
+class TickScheduler(QObject):
+    """Emits a tick on every wall-clock interval boundary without drifting."""
+
+    tick = pyqtSignal(object)
+    resynced = pyqtSignal(float)
+
+    # A tick further than this from its target means the wall clock jumped
+    # or the machine was suspended.
+    JUMP_THRESHOLD = 2.0
+    # Shots that fire this close before the boundary display the boundary.
+    EARLY_TOLERANCE = 0.05
+
+    def __init__(self, parent=None, interval=1.0):
+        """Initialize the scheduler with an interval in seconds."""
+        super().__init__(parent)
+        self.interval = interval
+        self.target = None
+        self.last_timestamp = None
+        self.last_skew = 0.0
+        self.max_skew = 0.0
+        self.resync_count = 0
+        self.paused = False
+        self.watched_widget = None
+        self.watched_window = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_timeout)
+
+    def start(self):
+        """Emit a tick right away and arm the timer for the next boundary."""
+        self.emit_tick(time.time())
+        self.arm()
+
+    def stop(self):
+        """Stop ticking."""
+        self.timer.stop()
+        self.target = None
+
+    def pause(self):
+        """Stop ticking until resume is called."""
+        if not self.paused:
+            self.paused = True
+            self.stop()
+
+    def resume(self):
+        """Catch up with an immediate tick and continue on the next boundary."""
+        if self.paused:
+            self.paused = False
+            self.start()
+
+    def follow_visibility(self, widget):
+        """Pause while the widget is hidden or its window is not exposed."""
+        self.watched_widget = widget
+        widget.installEventFilter(self)
+
+    def watch_window(self, window):
+        """Follow the exposure of the native window the watched widget lives in."""
+        if window is self.watched_window:
+            return
+        if self.watched_window is not None:
+            try:
+                self.watched_window.removeEventFilter(self)
+            except RuntimeError:
+                pass  # The old native window was already destroyed
+        self.watched_window = window
+        if window is not None:
+            window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.watched_widget:
+            if event.type() == QEvent.Show:
+                # The window handle changes whenever the native window is recreated
+                self.watch_window(obj.window().windowHandle())
+                self.resume()
+            elif event.type() == QEvent.Hide:
+                self.pause()
+        elif obj is self.watched_window and event.type() == QEvent.Expose:
+            if obj.isExposed():
+                self.resume()
+            else:
+                self.pause()
+        return False
+
+    def is_active(self):
+        """Return True if the scheduler is armed."""
+        return self.timer.isActive()
+
+    def set_interval(self, interval):
+        """Change the tick interval and re-arm for the next boundary."""
+        self.interval = interval
+        if self.timer.isActive():
+            self.arm()
+
+    def arm(self):
+        """Arm the single-shot timer for the next interval boundary."""
+        now = time.time()
+        self.target = (math.floor(now / self.interval) + 1) * self.interval
+        delay_ms = max(1, math.ceil((self.target - now) * 1000))
+        self.timer.start(delay_ms)
+
+    def on_timeout(self):
+        """Handle a timer shot, resyncing if the wall clock moved under us."""
+        now = time.time()
+        target = self.target
+        if target is None or abs(now - target) > self.JUMP_THRESHOLD:
+            self.resync_count += 1
+            self.resynced.emit(0.0 if target is None else now - target)
+            self.last_skew = 0.0
+            self.emit_tick(now)
+        else:
+            self.last_skew = now - target
+            self.max_skew = max(self.max_skew, abs(self.last_skew))
+            metrics.observe('timer_lateness_ms', max(0.0, self.last_skew) * 1000)
+            # A shot that fires a hair early must still show the new second.
+            shown = target if target - self.EARLY_TOLERANCE <= now < target else now
+            self.emit_tick(shown)
+        self.arm()
+
+    def emit_tick(self, timestamp):
+        """Emit the tick signal for the given POSIX timestamp."""
+        self.last_timestamp = timestamp
+        self.tick.emit(datetime.datetime.fromtimestamp(timestamp))
+
+    def get_skew_ms(self):
+        """Return the last and maximum measured display skew in milliseconds."""
+        return {'last': self.last_skew * 1000, 'max': self.max_skew * 1000}
@@ -0,0 +1,63 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+def get_utc_offset(zone, timestamp):
+    """Return the UTC offset of a zone at a POSIX timestamp, in seconds."""
+    return datetime.datetime.fromtimestamp(timestamp, zone).utcoffset().total_seconds()
+
+class ZoneOffsetCache:
+    """UTC offsets for a list of time zones, recomputed only when a zone's next transition passes."""
+
+    # Transitions are searched for in weekly steps up to a bit over a year ahead
+    SEARCH_STEP = 7 * 86400
+    SEARCH_LIMIT = 400 * 86400
+
+    def __init__(self, zone_names):
+        """Initialize the cache for the given IANA zone names."""
+        self.zones = [ZoneInfo(name) for name in zone_names]
+        self.offsets = [0.0] * len(self.zones)
+        self.valid_from = [0.0] * len(self.zones)
+        self.valid_until = [0.0] * len(self.zones)
+        self.earliest_valid = float('inf')
+        self.next_transition = float('-inf')
+
+    def get_offsets(self, timestamp):
+        """Return the list of UTC offsets, in zone order, valid at the timestamp."""
+        if not self.earliest_valid <= timestamp < self.next_transition:
+            for i in range(len(self.zones)):
+                if not self.valid_from[i] <= timestamp < self.valid_until[i]:
+                    self.refresh(i, timestamp)
+            self.earliest_valid = max(self.valid_from, default=float('-inf'))
+            self.next_transition = min(self.valid_until, default=float('inf'))
+        return self.offsets
+
+    def refresh(self, index, timestamp):
+        """Recompute the offset of one zone and how long it stays valid."""
+        zone = self.zones[index]
+        offset = get_utc_offset(zone, timestamp)
+        self.offsets[index] = offset
+        self.valid_from[index] = timestamp
+        self.valid_until[index] = self.find_next_transition(zone, timestamp, offset)
+
+    def find_next_transition(self, zone, timestamp, offset):
+        """Return the first second after timestamp at which the zone's offset changes."""
+        low = timestamp
+        while low - timestamp < self.SEARCH_LIMIT:
+            high = low + self.SEARCH_STEP
+            if get_utc_offset(zone, high) != offset:
+                # Bisect down to the exact second of the transition
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if get_utc_offset(zone, middle) == offset:
+                        low = middle
+                    else:
+                        high = middle
+                return high
+            low = high
+        return low
+
+    def get_local_time(self, timestamp, offset):
+        """Return the naive local datetime for a timestamp and UTC offset."""
+        return EPOCH + datetime.timedelta(seconds=timestamp + offset)